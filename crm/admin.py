@@ -1,8 +1,128 @@
-from django.contrib import admin
+from collections import defaultdict
+from decimal import Decimal
+
+from django.contrib import admin, messages
+from django.core.paginator import Paginator
+from django.db import connections, transaction
+from django.utils.functional import cached_property
+
 from .models import Client, Project
+from .reports import billing_month, bump_revenue
+
+
+class EstimatedCountPaginator(Paginator):
+    # The default paginator runs an exact COUNT(*) over the whole table on every
+    # changelist page. Here we count at most `exact_limit + 1` rows; past that the
+    # number only drives the page links, so Postgres' planner estimate is good enough.
+    exact_limit = 10000
+
+    @cached_property
+    def count(self):
+        capped = self.object_list[: self.exact_limit + 1].count()
+        if capped <= self.exact_limit:
+            return capped
+        return max(self._estimate(), capped)
+
+    def _estimate(self):
+        qs = self.object_list
+        connection = connections[qs.db]
+        if connection.vendor != "postgresql" or qs.query.where:
+            # No cheap estimate for filtered lists; report the capped count.
+            return 0
+        with connection.cursor() as cursor:
+            cursor.execute(
+                "SELECT reltuples::bigint FROM pg_class WHERE oid = %s::regclass",
+                [qs.model._meta.db_table],
+            )
+            row = cursor.fetchone()
+        return int(row[0]) if row else 0
+
+
+class ScalableAdmin(admin.ModelAdmin):
+    paginator = EstimatedCountPaginator
+    show_full_result_count = False  # skips the second, unfiltered COUNT(*)
+    list_per_page = 50
+
+
+# Project columns that decide which MonthlyRevenue bucket a row counts towards.
+REVENUE_FIELDS = ("owner_id", "due_date", "start_date", "payment_currency", "payment_status", "payment_amount")
+
+
+def _chunked_update(queryset, chunk_size=1000, **changes):
+    # Walks the selection in primary-key order and issues one UPDATE per chunk, so
+    # "select all" on a huge table never holds one giant lock or id list.
+    # .update() skips the signals that maintain the revenue rollup, so each chunk
+    # moves its own rows between buckets, in the same transaction and with the rows
+    # locked, so concurrent saves can't slip a bump in between.
+    updated = 0
+    last_pk = 0
+    while True:
+        with transaction.atomic():
+            rows = list(
+                queryset.filter(pk__gt=last_pk)
+                .order_by("pk")
+                .select_for_update(of=("self",))
+                .values_list("pk", *REVENUE_FIELDS)[:chunk_size]
+            )
+            if not rows:
+                return updated
+            updated += queryset.model.objects.filter(pk__in=[row[0] for row in rows]).update(**changes)
+            _move_revenue(rows, changes)
+        last_pk = rows[-1][0]
+
+
+def _move_revenue(rows, changes):
+    # Net amount/count change per (owner, month, currency, payment_status) bucket for
+    # a chunk of rows (pk, *REVENUE_FIELDS), applied with one F() bump per bucket.
+    deltas = defaultdict(lambda: [Decimal("0.00"), 0])
+    for row in rows:
+        old = dict(zip(REVENUE_FIELDS, row[1:]))
+        new = {**old, **{field: value for field, value in changes.items() if field in old}}
+        for values, sign in ((old, -1), (new, 1)):
+            bucket = (
+                values["owner_id"], billing_month(values["due_date"], values["start_date"]),
+                values["payment_currency"], values["payment_status"],
+            )
+            deltas[bucket][0] += sign * values["payment_amount"]
+            deltas[bucket][1] += sign
+    for (owner_id, month, currency, payment_status), (amount, count) in deltas.items():
+        bump_revenue(owner_id, month, currency, payment_status, amount=amount, count=count)
+
+
+@admin.register(Client)
+class ClientAdmin(ScalableAdmin):
+    list_display = ("name", "email", "phone", "company", "owner", "created_at")
+    list_select_related = ("owner",)
+    search_fields = ("name", "email", "company")  # also powers Project.client autocomplete
+    raw_id_fields = ("owner",)
+    ordering = ("-id",)
+
+
+@admin.register(Project)
+class ProjectAdmin(ScalableAdmin):
+    list_display = (
+        "title", "client", "owner", "status", "payment_status",
+        "payment_currency", "payment_amount", "due_date",
+    )
+    list_select_related = ("client", "owner")
+    list_filter = ("status", "payment_status", "payment_currency")
+    search_fields = ("title",)
+    autocomplete_fields = ("client",)
+    ordering = ("-id",)
+    actions = ("mark_paid", "mark_unpaid", "mark_completed")
+
+    def _bulk_update(self, request, queryset, message, **changes):
+        updated = _chunked_update(queryset, **changes)
+        self.message_user(request, f"{updated} project(s) {message}.", messages.SUCCESS)
 
-admin.site.register(Client)
-admin.site.register(Project)
+    @admin.action(description="Mark selected projects as paid")
+    def mark_paid(self, request, queryset):
+        self._bulk_update(request, queryset, "marked as paid", payment_status="paid")
 
+    @admin.action(description="Mark selected projects as unpaid")
+    def mark_unpaid(self, request, queryset):
+        self._bulk_update(request, queryset, "marked as unpaid", payment_status="unpaid")
 
-# Register your models here.
\ No newline at end of file
+    @admin.action(description="Mark selected projects as completed")
+    def mark_completed(self, request, queryset):
+        self._bulk_update(request, queryset, "marked as completed", status="completed")
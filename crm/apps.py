@@ -4,3 +4,9 @@ from django.apps import AppConfig
 class CrmConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'crm'
+
+    def ready(self):
+        # Registers the signal receivers that keep MonthlyRevenue up to date, and the
+        # one that records when each DB connection was opened (for /api/ready/).
+        from . import signals  # noqa: F401
+        from . import readiness  # noqa: F401
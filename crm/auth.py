@@ -0,0 +1,52 @@
+from rest_framework import serializers, permissions, status
+from rest_framework.response import Response
+from rest_framework.views import APIView
+from rest_framework_simplejwt.exceptions import InvalidToken, TokenError
+from rest_framework_simplejwt.serializers import TokenRefreshSerializer
+from rest_framework_simplejwt.settings import api_settings
+from rest_framework_simplejwt.tokens import RefreshToken
+
+from .revocation import revocations
+
+
+class RotatingTokenRefreshSerializer(TokenRefreshSerializer):
+    # With ROTATE_REFRESH_TOKENS on, every refresh returns a new refresh token; the
+    # one that was just used is revoked so it can't be replayed. The unique jti row
+    # decides races: if two refreshes with the same token run at once, only the one
+    # that inserts it gets new tokens.
+    def validate(self, attrs):
+        old = self.token_class(attrs["refresh"])
+        if revocations.is_revoked(old):
+            raise InvalidToken({"detail": "Token has been revoked.", "code": "token_revoked"})
+        data = super().validate(attrs)
+        if "refresh" in data and not revocations.revoke(old):
+            raise InvalidToken({"detail": "Token has been revoked.", "code": "token_revoked"})
+        return data
+
+
+class LogoutSerializer(serializers.Serializer):
+    refresh = serializers.CharField(required=False)
+
+
+class LogoutView(APIView):
+    # POST /api/auth/logout/ {"refresh": "<token>"}
+    # Revokes the access token used for this call and, if given, the refresh token.
+    permission_classes = [permissions.IsAuthenticated]
+
+    def post(self, request):
+        serializer = LogoutSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+
+        raw_refresh = serializer.validated_data.get("refresh")
+        if raw_refresh:
+            try:
+                refresh = RefreshToken(raw_refresh)
+            except TokenError as e:
+                raise InvalidToken({"detail": str(e)})
+            if str(refresh.get(api_settings.USER_ID_CLAIM)) != str(request.user.pk):
+                raise serializers.ValidationError({"refresh": "Token belongs to another user."})
+            revocations.revoke(refresh)
+
+        if request.auth is not None:
+            revocations.revoke(request.auth)
+        return Response(status=status.HTTP_205_RESET_CONTENT)
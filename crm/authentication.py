@@ -0,0 +1,15 @@
+# Kept apart from crm/auth.py: DRF imports authentication classes while
+# rest_framework.views is still loading, so this module must not import views.
+from rest_framework_simplejwt.authentication import JWTAuthentication
+from rest_framework_simplejwt.exceptions import InvalidToken
+
+from .revocation import revocations
+
+
+class RevocationAwareJWTAuthentication(JWTAuthentication):
+    # JWTAuthentication plus an in-memory revocation check (no extra DB query).
+    def get_validated_token(self, raw_token):
+        token = super().get_validated_token(raw_token)
+        if revocations.is_revoked(token):
+            raise InvalidToken({"detail": "Token has been revoked.", "code": "token_revoked"})
+        return token
@@ -0,0 +1,128 @@
+import json
+import logging
+from concurrent.futures import ThreadPoolExecutor
+
+from django.conf import settings
+from django.db import connections, transaction
+from django.test import RequestFactory
+from django.urls import Resolver404, resolve
+from rest_framework import serializers, permissions, status
+from rest_framework.response import Response
+from rest_framework.views import APIView
+
+logger = logging.getLogger(__name__)
+
+# Sub-requests may only target routes from crm/urls.py, which is mounted at /api/.
+API_PREFIX = "/api/"
+
+
+class SubRequestSerializer(serializers.Serializer):
+    id = serializers.CharField(required=False)
+    method = serializers.ChoiceField(choices=["GET", "POST", "PUT", "PATCH", "DELETE"], default="GET")
+    path = serializers.CharField()
+    body = serializers.JSONField(required=False)
+
+    def validate_path(self, value):
+        if not value.startswith(API_PREFIX):
+            raise serializers.ValidationError(f"Path must start with {API_PREFIX}")
+        return value
+
+
+class BatchSerializer(serializers.Serializer):
+    requests = SubRequestSerializer(many=True, allow_empty=False)
+    # atomic → run every sub-request in one DB transaction; rolled back if any fails.
+    atomic = serializers.BooleanField(default=False)
+    # parallel → run independent reads concurrently (GET only, not with atomic).
+    parallel = serializers.BooleanField(default=False)
+
+    def validate_requests(self, value):
+        limit = settings.BATCH_MAX_REQUESTS
+        if len(value) > limit:
+            raise serializers.ValidationError(f"At most {limit} requests per batch.")
+        return value
+
+    def validate(self, attrs):
+        if attrs["parallel"]:
+            if attrs["atomic"]:
+                raise serializers.ValidationError("parallel and atomic cannot be combined.")
+            if any(sub["method"] != "GET" for sub in attrs["requests"]):
+                raise serializers.ValidationError("parallel is only allowed for GET requests.")
+        return attrs
+
+
+class BatchView(APIView):
+    # POST /api/batch/
+    # {"requests": [{"id": "c", "method": "GET", "path": "/api/clients/"}, ...],
+    #  "atomic": false, "parallel": false}
+    # The caller is authenticated once for the whole batch; every sub-request reuses
+    # that user instead of decoding the JWT and loading the user again.
+    permission_classes = [permissions.IsAuthenticated]
+
+    def post(self, request):
+        serializer = BatchSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        batch = serializer.validated_data
+        subs = batch["requests"]
+
+        if batch["parallel"]:
+            with ThreadPoolExecutor(max_workers=min(settings.BATCH_MAX_WORKERS, len(subs))) as pool:
+                responses = list(pool.map(lambda sub: self._run_in_thread(request, sub), subs))
+        elif batch["atomic"]:
+            with transaction.atomic():
+                responses = [self._run(request, sub) for sub in subs]
+                if any(resp["status"] >= 400 for resp in responses):
+                    transaction.set_rollback(True)
+        else:
+            responses = [self._run(request, sub) for sub in subs]
+
+        return Response({"responses": responses}, status=status.HTTP_200_OK)
+
+    def _run_in_thread(self, request, sub):
+        try:
+            return self._run(request, sub)
+        finally:
+            # Worker threads get their own DB connections; don't leak them.
+            connections.close_all()
+
+    def _run(self, request, sub):
+        result = {"id": sub.get("id"), "status": status.HTTP_200_OK, "body": None}
+        path = sub["path"]
+
+        try:
+            match = resolve("/" + path[len(API_PREFIX):].split("?", 1)[0], urlconf="crm.urls")
+        except Resolver404:
+            match = None
+        if match is None or getattr(match.func, "view_class", None) is BatchView:
+            result.update(status=status.HTTP_404_NOT_FOUND, body={"detail": "Not found."})
+            return result
+
+        body = sub.get("body")
+        sub_request = RequestFactory().generic(
+            sub["method"],
+            path,
+            data=json.dumps(body) if body is not None else "",
+            content_type="application/json",
+            secure=request.is_secure(),
+            HTTP_HOST=request.get_host(),
+        )
+        # DRF picks these up and skips its authenticators (same trick as force_authenticate).
+        sub_request._force_auth_user = request.user
+        sub_request._force_auth_token = request.auth
+
+        try:
+            response = match.func(sub_request, *match.args, **match.kwargs)
+        except Exception:
+            logger.exception("Batch sub-request %s %s failed", sub["method"], path)
+            result.update(status=status.HTTP_500_INTERNAL_SERVER_ERROR, body={"detail": "Server error."})
+            return result
+
+        result["status"] = response.status_code
+        if hasattr(response, "data"):
+            # DRF response: hand back the data as-is, no render/parse round trip.
+            result["body"] = response.data
+        elif response.content:
+            try:
+                result["body"] = json.loads(response.content)
+            except ValueError:
+                result["body"] = response.content.decode(errors="replace")
+        return result
@@ -0,0 +1,66 @@
+# Duplicate-client detection and merging.
+# Instead of comparing every pair of clients, candidates are "blocked" on the
+# hashed lookup keys kept on Client: one GROUP BY per key finds the keys shared by
+# more than one client, and only those clients are loaded.
+from django.db import transaction
+from django.db.models import Count
+
+from .models import Client, Project
+
+KEY_FIELDS = {"phone_key": "phone", "email_key": "email", "company_key": "company"}
+
+
+def find_duplicate_groups(owner):
+    clients = Client.objects.filter(owner=owner)
+
+    # client id → set of reasons, and union-find parent links across shared keys
+    reasons = {}
+    parent = {}
+
+    def find(x):
+        while parent[x] != x:
+            parent[x] = parent[parent[x]]
+            x = parent[x]
+        return x
+
+    for key_field, reason in KEY_FIELDS.items():
+        shared = (
+            clients.exclude(**{key_field: ""})
+            .values(key_field)
+            .annotate(n=Count("id"))
+            .filter(n__gt=1)
+            .values_list(key_field, flat=True)
+        )
+        members = {}
+        for client_id, key in clients.filter(**{f"{key_field}__in": shared}).values_list("id", key_field):
+            members.setdefault(key, []).append(client_id)
+        for ids in members.values():
+            for client_id in ids:
+                parent.setdefault(client_id, client_id)
+                reasons.setdefault(client_id, set()).add(reason)
+            root = find(ids[0])
+            for client_id in ids[1:]:
+                parent[find(client_id)] = root
+
+    groups = {}
+    for client_id in parent:
+        groups.setdefault(find(client_id), []).append(client_id)
+
+    by_id = clients.in_bulk(parent.keys())
+    return [
+        {
+            "reasons": sorted(set().union(*(reasons[i] for i in ids))),
+            "clients": [by_id[i] for i in sorted(ids)],
+        }
+        for ids in sorted(groups.values())
+    ]
+
+
+def merge_clients(target, duplicate_ids):
+    # Moves every project of the duplicates onto target with a single UPDATE, then
+    # deletes the duplicates. All clients belong to the same owner, so
+    # Project.owner and the revenue rollup don't change.
+    with transaction.atomic():
+        moved = Project.objects.filter(client_id__in=duplicate_ids).update(client_id=target.id)
+        Client.objects.filter(id__in=duplicate_ids).delete()
+    return moved
@@ -0,0 +1,74 @@
+from django.core import exceptions
+from django.db import models
+from django.utils.functional import cached_property
+
+
+class EnumCodeField(models.PositiveSmallIntegerField):
+    # A choice field stored as a 2-byte integer code instead of a repeated string.
+    # Python code, filters, serializers and the admin still see the string values
+    # ("paid", "USD", …); the mapping to codes happens only at the DB boundary.
+    #
+    #   codes   → {"paid": 3, ...}; codes are stored, so never renumber one.
+    #   aliases → extra spellings accepted on input, e.g. {"ongoing": "active"}.
+    def __init__(self, *args, codes=None, aliases=None, **kwargs):
+        self.codes = dict(codes or {})
+        self.aliases = dict(aliases or {})
+        self.values_by_code = {code: value for value, code in self.codes.items()}
+        super().__init__(*args, **kwargs)
+
+    def deconstruct(self):
+        name, path, args, kwargs = super().deconstruct()
+        kwargs["codes"] = self.codes
+        if self.aliases:
+            kwargs["aliases"] = self.aliases
+        return name, path, args, kwargs
+
+    @cached_property
+    def validators(self):
+        # Skip IntegerField's range validators: the Python-side value is a string.
+        return [*self.default_validators, *self._validators]
+
+    def get_internal_type(self):
+        return "PositiveSmallIntegerField"
+
+    def normalize(self, value):
+        # Canonical string for any accepted spelling; unknown strings pass through
+        # unchanged so validation can report them.
+        if isinstance(value, str):
+            key = value.strip().lower()
+            key = self.aliases.get(key, key)
+            for known in self.codes:
+                if known.lower() == key:
+                    return known
+        return value
+
+    def to_python(self, value):
+        if value is None:
+            return None
+        if isinstance(value, int) and value in self.values_by_code:
+            return self.values_by_code[value]
+        return self.normalize(value)
+
+    def from_db_value(self, value, expression, connection):
+        if value is None:
+            return None
+        return self.values_by_code.get(value, value)
+
+    def get_prep_value(self, value):
+        if value is None or isinstance(value, models.expressions.Combinable):
+            return value
+        value = self.to_python(value)
+        try:
+            return self.codes[value]
+        except (KeyError, TypeError):
+            raise exceptions.ValidationError(
+                f"{value!r} is not a valid choice for {self.name}.", code="invalid_choice"
+            )
+
+    def get_db_prep_value(self, value, connection, prepared=False):
+        if not prepared:
+            value = self.get_prep_value(value)
+        return value
+
+    def value_to_string(self, obj):
+        return self.value_from_object(obj)
@@ -0,0 +1,102 @@
+# Structured, non-blocking logging used by LOGGING in crm_project/settings.py.
+#   JsonFormatter       → one JSON object per line
+#   QueuedStreamHandler → request threads only enqueue; a background thread writes
+#   SampleFilter        → keeps ~rate of low-level records from chatty loggers
+#   RequestContextFilter + RequestLogMiddleware → request_id / timing on every record
+import atexit
+import json
+import logging
+import random
+import time
+import uuid
+from contextvars import ContextVar
+from logging.handlers import QueueHandler, QueueListener
+from queue import SimpleQueue
+
+request_id_var = ContextVar("request_id", default=None)
+
+# Attributes every LogRecord has; anything else was passed through `extra=`.
+_RECORD_ATTRS = set(vars(logging.LogRecord("", 0, "", 0, "", None, None))) | {"message", "asctime"}
+
+
+class JsonFormatter(logging.Formatter):
+    def format(self, record):
+        payload = {
+            "ts": self.formatTime(record, "%Y-%m-%dT%H:%M:%S"),
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage(),
+        }
+        for key, value in vars(record).items():
+            if key not in _RECORD_ATTRS and not key.startswith("_"):
+                payload[key] = value
+        if record.exc_info:
+            payload["exc"] = self.formatException(record.exc_info)
+        return json.dumps(payload, default=str)
+
+
+class RequestContextFilter(logging.Filter):
+    # Stamps the current request's id (set by RequestLogMiddleware) on each record.
+    def filter(self, record):
+        record.request_id = request_id_var.get()
+        return True
+
+
+class SampleFilter(logging.Filter):
+    # Lets through roughly `rate` of records below `always_level`;
+    # warnings and errors are never dropped.
+    def __init__(self, rate=1.0, always_level="WARNING"):
+        super().__init__()
+        self.rate = float(rate)
+        self.always_level = logging.getLevelName(always_level)
+
+    def filter(self, record):
+        return record.levelno >= self.always_level or random.random() < self.rate
+
+
+class QueuedStreamHandler(QueueHandler):
+    # A QueueHandler that owns its QueueListener, so it can be declared directly in
+    # LOGGING (dictConfig on Python < 3.12 can't wire a listener up by itself).
+    # The record is formatted on the calling thread; the write happens on the
+    # listener's thread, so request threads never block on stdout/stderr.
+    def __init__(self, stream=None):
+        super().__init__(SimpleQueue())
+        target = logging.StreamHandler(stream)
+        target.setFormatter(logging.Formatter("%(message)s"))
+        self.listener = QueueListener(self.queue, target)
+        self.listener.start()
+        atexit.register(self._stop_listener)
+
+    def _stop_listener(self):
+        # Flushes whatever is still queued; safe to call more than once.
+        if self.listener._thread is not None:
+            self.listener.stop()
+
+    def close(self):
+        self._stop_listener()
+        super().close()
+
+
+class RequestLogMiddleware:
+    # Assigns a request id (or reuses the caller's X-Request-ID), exposes it in the
+    # response, and writes one access-log line with the request's duration.
+    logger = logging.getLogger("crm.request")
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        request_id = request.headers.get("X-Request-ID", "")[:64] or uuid.uuid4().hex
+        token = request_id_var.set(request_id)
+        started = time.perf_counter()
+        try:
+            response = self.get_response(request)
+            duration_ms = round((time.perf_counter() - started) * 1000, 2)
+            response["X-Request-ID"] = request_id
+            self.logger.info(
+                "%s %s %s", request.method, request.path, response.status_code,
+                extra={"status": response.status_code, "duration_ms": duration_ms},
+            )
+            return response
+        finally:
+            request_id_var.reset(token)
@@ -0,0 +1,18 @@
+from django.core.management.base import BaseCommand
+
+from crm.reports import rebuild_revenue
+
+
+class Command(BaseCommand):
+    help = "Rebuild the MonthlyRevenue rollup table from existing Project rows."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--owner",
+            type=int,
+            help="Only rebuild the rollup for this user id.",
+        )
+
+    def handle(self, *args, **options):
+        buckets = rebuild_revenue(owner_id=options["owner"])
+        self.stdout.write(self.style.SUCCESS(f"Rebuilt {buckets} revenue buckets."))
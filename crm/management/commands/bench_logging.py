@@ -0,0 +1,68 @@
+import logging
+import tempfile
+import time
+
+from django.core.management.base import BaseCommand
+
+from crm.log import JsonFormatter, QueuedStreamHandler, RequestContextFilter, SampleFilter
+
+
+class Command(BaseCommand):
+    help = (
+        "Measure logging overhead per simulated request: the old synchronous root "
+        "DEBUG StreamHandler vs the queued JSON handler with SQL sampling."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--requests", type=int, default=2000)
+        parser.add_argument(
+            "--sql-per-request", type=int, default=10,
+            help="SQL debug records emitted per request (as django.db.backends does under DEBUG).",
+        )
+        parser.add_argument("--sample-rate", type=float, default=0.01)
+
+    def handle(self, *args, **options):
+        n = options["requests"]
+        sql = options["sql_per_request"]
+
+        with tempfile.TemporaryFile("w") as stream:
+            sync_handler = logging.StreamHandler(stream)
+            sync_us = self._run(sync_handler, None, n, sql)
+
+        with tempfile.TemporaryFile("w") as stream:
+            queued_handler = QueuedStreamHandler(stream)
+            queued_handler.setFormatter(JsonFormatter())
+            queued_handler.addFilter(RequestContextFilter())
+            sampler = SampleFilter(rate=options["sample_rate"])
+            queued_us = self._run(queued_handler, sampler, n, sql)
+            default_us = self._run(queued_handler, None, n, sql, sql_level=logging.WARNING)
+            queued_handler.close()  # drains the queue before the file goes away
+
+        self.stdout.write(f"sync StreamHandler, all SQL:     {sync_us:8.1f} µs/request")
+        self.stdout.write(f"queued JSON, sampled SQL:        {queued_us:8.1f} µs/request")
+        self.stdout.write(f"queued JSON, SQL off (default):  {default_us:8.1f} µs/request")
+
+    def _run(self, handler, sql_filter, n, sql_per_request, sql_level=logging.DEBUG):
+        # Private loggers so the project's LOGGING config doesn't interfere.
+        request_logger = logging.getLogger("bench.request")
+        sql_logger = logging.getLogger("bench.db")
+        for logger in (request_logger, sql_logger):
+            logger.handlers = [handler]
+            logger.setLevel(logging.DEBUG)
+            logger.propagate = False
+            logger.filters = []
+        sql_logger.setLevel(sql_level)
+        if sql_filter is not None:
+            sql_logger.addFilter(sql_filter)
+
+        started = time.perf_counter()
+        for i in range(n):
+            for _ in range(sql_per_request):
+                sql_logger.debug("(0.001) SELECT * FROM crm_project WHERE owner_id = %s", i)
+            request_logger.info("GET /api/projects/ 200", extra={"duration_ms": 1.0})
+        elapsed = time.perf_counter() - started
+
+        for logger in (request_logger, sql_logger):
+            logger.handlers = []
+            logger.filters = []
+        return elapsed / n * 1_000_000
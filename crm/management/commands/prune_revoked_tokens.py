@@ -0,0 +1,14 @@
+from django.core.management.base import BaseCommand
+from django.utils import timezone
+
+from crm.models import RevokedToken, TokenCutoff
+
+
+class Command(BaseCommand):
+    help = "Delete token revocations whose tokens have expired anyway."
+
+    def handle(self, *args, **options):
+        now = timezone.now()
+        tokens, _ = RevokedToken.objects.filter(expires_at__lte=now).delete()
+        cutoffs, _ = TokenCutoff.objects.filter(expires_at__lte=now).delete()
+        self.stdout.write(self.style.SUCCESS(f"Pruned {tokens} revoked tokens and {cutoffs} cutoffs."))
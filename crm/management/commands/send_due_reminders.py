@@ -0,0 +1,36 @@
+from django.core.management.base import BaseCommand
+from django.utils import timezone
+
+from crm.reminders import queue_due_reminders
+
+
+class Command(BaseCommand):
+    help = "Write overdue / due-soon reminders for open projects to the reminder outbox."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--days", type=int, default=7, help="How far ahead counts as due soon.")
+        parser.add_argument("--owner-batch", type=int, default=500)
+        parser.add_argument("--chunk-size", type=int, default=2000)
+        parser.add_argument(
+            "--time-limit", type=float,
+            help="Stop after this many seconds; resume with --after-owner.",
+        )
+        parser.add_argument("--after-owner", type=int, default=0)
+
+    def handle(self, *args, **options):
+        candidates, last_owner, finished = queue_due_reminders(
+            today=timezone.localdate(),
+            days=options["days"],
+            owner_batch=options["owner_batch"],
+            chunk_size=options["chunk_size"],
+            time_limit=options["time_limit"],
+            after_owner=options["after_owner"],
+        )
+        # Reminders already in the outbox are skipped, so this is not "new reminders".
+        if finished:
+            self.stdout.write(self.style.SUCCESS(f"Checked {candidates} due projects."))
+        else:
+            self.stdout.write(self.style.WARNING(
+                f"Time limit hit after checking {candidates} due projects; "
+                f"resume with --after-owner {last_owner}."
+            ))
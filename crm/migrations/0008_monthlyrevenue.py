@@ -0,0 +1,32 @@
+# Generated by Django 5.2.4 on 2026-10-19 02:13
+
+import django.db.models.deletion
+from decimal import Decimal
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('crm', '0007_delete_invoice'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='MonthlyRevenue',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('month', models.DateField()),
+                ('payment_currency', models.CharField(choices=[('USD', 'USD - US Dollar'), ('KES', 'KES - Kenyan Shilling'), ('EUR', 'EUR - Euro'), ('GBP', 'GBP - British Pound')], max_length=3)),
+                ('payment_status', models.CharField(choices=[('paid', 'Paid'), ('unpaid', 'Unpaid'), ('partial', 'Partially paid')], max_length=10)),
+                ('project_count', models.IntegerField(default=0)),
+                ('total_amount', models.DecimalField(decimal_places=2, default=Decimal('0.00'), max_digits=14)),
+                ('owner', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='revenue_rollups', to=settings.AUTH_USER_MODEL)),
+            ],
+            options={
+                'constraints': [models.UniqueConstraint(fields=('owner', 'month', 'payment_currency', 'payment_status'), name='crm_monthlyrevenue_unique_bucket')],
+            },
+        ),
+    ]
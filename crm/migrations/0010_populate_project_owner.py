@@ -0,0 +1,24 @@
+from django.db import migrations, models
+
+
+def copy_owner_from_client(apps, schema_editor):
+    Client = apps.get_model("crm", "Client")
+    Project = apps.get_model("crm", "Project")
+    Project.objects.filter(owner__isnull=True).update(
+        owner_id=models.Subquery(
+            Client.objects.filter(pk=models.OuterRef("client_id")).values("owner_id")[:1]
+        )
+    )
+
+
+class Migration(migrations.Migration):
+    # Kept separate from the schema changes around it so Postgres doesn't refuse the
+    # ALTER TABLE with "pending trigger events" from the UPDATE.
+
+    dependencies = [
+        ('crm', '0009_project_owner'),
+    ]
+
+    operations = [
+        migrations.RunPython(copy_owner_from_client, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,28 @@
+from django.db import migrations
+
+from crm.normalize import client_keys
+
+
+def fill_lookup_keys(apps, schema_editor):
+    Client = apps.get_model("crm", "Client")
+    batch = []
+    for client in Client.objects.only("id", "phone", "email", "company").iterator(chunk_size=2000):
+        for field, key in client_keys(client.phone, client.email, client.company).items():
+            setattr(client, field, key)
+        batch.append(client)
+        if len(batch) >= 2000:
+            Client.objects.bulk_update(batch, ["phone_key", "email_key", "company_key"])
+            batch = []
+    if batch:
+        Client.objects.bulk_update(batch, ["phone_key", "email_key", "company_key"])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('crm', '0013_client_lookup_keys'),
+    ]
+
+    operations = [
+        migrations.RunPython(fill_lookup_keys, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,48 @@
+# Generated by Django 5.2.4 on 2026-10-19 02:26
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('crm', '0015_token_revocation'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ReminderOutbox',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('kind', models.CharField(choices=[('overdue', 'Overdue'), ('due_soon', 'Due soon')], max_length=10)),
+                ('due_date', models.DateField()),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('sent_at', models.DateTimeField(blank=True, null=True)),
+            ],
+        ),
+        migrations.AddIndex(
+            model_name='project',
+            index=models.Index(condition=models.Q(('due_date__isnull', False), models.Q(('status', 'completed'), _negated=True)), fields=['owner', 'due_date'], name='crm_project_open_due_idx'),
+        ),
+        migrations.AddField(
+            model_name='reminderoutbox',
+            name='owner',
+            field=models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='reminders', to=settings.AUTH_USER_MODEL),
+        ),
+        migrations.AddField(
+            model_name='reminderoutbox',
+            name='project',
+            field=models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='reminders', to='crm.project'),
+        ),
+        migrations.AddIndex(
+            model_name='reminderoutbox',
+            index=models.Index(condition=models.Q(('sent_at__isnull', True)), fields=['created_at'], name='crm_reminder_pending_idx'),
+        ),
+        migrations.AddConstraint(
+            model_name='reminderoutbox',
+            constraint=models.UniqueConstraint(fields=('project', 'kind', 'due_date'), name='crm_reminderoutbox_unique_reminder'),
+        ),
+    ]
@@ -0,0 +1,28 @@
+import crm.fields
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+    # Step 1 of 3 (status / payment enums → small integer codes): add the new columns.
+
+    dependencies = [
+        ('crm', '0016_due_reminders'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='project',
+            name='status_code',
+            field=crm.fields.EnumCodeField(null=True, codes={'active': 1, 'on-hold': 2, 'completed': 3, 'cancelled': 4}),
+        ),
+        migrations.AddField(
+            model_name='project',
+            name='payment_status_code',
+            field=crm.fields.EnumCodeField(null=True, codes={'unpaid': 1, 'partial': 2, 'paid': 3}),
+        ),
+        migrations.AddField(
+            model_name='project',
+            name='payment_currency_code',
+            field=crm.fields.EnumCodeField(null=True, codes={'USD': 1, 'KES': 2, 'EUR': 3, 'GBP': 4}),
+        ),
+    ]
@@ -0,0 +1,65 @@
+from django.db import migrations
+
+# Frozen copies of the mappings in crm/models.py as of this migration.
+STATUS_CODES = {"active": 1, "on-hold": 2, "completed": 3, "cancelled": 4}
+STATUS_ALIASES = {
+    "ongoing": "active", "in progress": "active", "in-progress": "active", "open": "active",
+    "on hold": "on-hold", "onhold": "on-hold", "paused": "on-hold",
+    "complete": "completed", "done": "completed", "finished": "completed",
+    "canceled": "cancelled",
+}
+PAYMENT_CODES = {"unpaid": 1, "partial": 2, "paid": 3}
+CURRENCY_CODES = {"USD": 1, "KES": 2, "EUR": 3, "GBP": 4}
+
+
+# column → (code column, codes, aliases, value used for empty strings / NULL)
+COLUMNS = {
+    "status": ("status_code", STATUS_CODES, STATUS_ALIASES, "active"),
+    "payment_status": ("payment_status_code", PAYMENT_CODES, {}, "unpaid"),
+    "payment_currency": ("payment_currency_code", CURRENCY_CODES, {}, "USD"),
+}
+
+
+def _code(value, codes, aliases, default):
+    # Same rules for every column: trimmed, case-insensitive, aliases applied.
+    # None means "not recognised".
+    key = (value or "").strip().lower()
+    if not key:
+        return codes[default]
+    key = aliases.get(key, key)
+    for known, code in codes.items():
+        if known.lower() == key:
+            return code
+    return None
+
+
+def fill_codes(apps, schema_editor):
+    # One UPDATE per distinct stored value rather than per row. Values that can't be
+    # mapped stop the migration (and roll it back) instead of being guessed.
+    Project = apps.get_model("crm", "Project")
+    unknown = []
+    for column, (code_column, codes, aliases, default) in COLUMNS.items():
+        for value in Project.objects.values_list(column, flat=True).distinct():
+            rows = Project.objects.filter(**{column: value})
+            code = _code(value, codes, aliases, default)
+            if code is None:
+                unknown.append(f"{column}={value!r} ({rows.count()} rows)")
+            else:
+                rows.update(**{code_column: code})
+    if unknown:
+        raise RuntimeError(
+            "Unrecognised Project values: " + ", ".join(unknown) + ". Update them to a "
+            "known value (or add an alias in this migration) and run migrate again."
+        )
+
+
+class Migration(migrations.Migration):
+    # Step 2 of 3: normalize the old strings into codes.
+
+    dependencies = [
+        ('crm', '0017_project_enum_codes'),
+    ]
+
+    operations = [
+        migrations.RunPython(fill_codes, migrations.RunPython.noop),
+    ]
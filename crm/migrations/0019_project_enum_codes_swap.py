@@ -0,0 +1,89 @@
+import crm.fields
+from decimal import Decimal
+
+from django.db import migrations, models
+from django.db.models.functions import Coalesce, TruncMonth
+
+
+def rebuild_revenue(apps, schema_editor):
+    # 0018 may have changed payment_status / payment_currency spellings ("Paid" →
+    # "paid"), so recompute the MonthlyRevenue rollup from the normalized rows.
+    # Same query as crm.reports.rebuild_revenue, on the historical models.
+    Project = apps.get_model("crm", "Project")
+    MonthlyRevenue = apps.get_model("crm", "MonthlyRevenue")
+    rows = (
+        Project.objects
+        .annotate(month=TruncMonth(Coalesce("due_date", "start_date")))
+        .values("owner_id", "month", "payment_currency", "payment_status")
+        .annotate(project_count=models.Count("id"), total_amount=models.Sum("payment_amount"))
+        .order_by()
+    )
+    MonthlyRevenue.objects.all().delete()
+    MonthlyRevenue.objects.bulk_create(
+        [
+            MonthlyRevenue(
+                owner_id=row["owner_id"],
+                month=row["month"],
+                payment_currency=row["payment_currency"],
+                payment_status=row["payment_status"],
+                project_count=row["project_count"],
+                total_amount=row["total_amount"] or Decimal("0.00"),
+            )
+            for row in rows
+        ],
+        batch_size=1000,
+    )
+
+
+class Migration(migrations.Migration):
+    # Step 3 of 3: drop the string columns and their indexes, move the code columns
+    # into their place, rebuild the indexes on the narrower columns, then the revenue rollup.
+
+    dependencies = [
+        ('crm', '0018_populate_project_enum_codes'),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(model_name='project', name='crm_project_status_idx'),
+        migrations.RemoveIndex(model_name='project', name='crm_project_pay_status_idx'),
+        migrations.RemoveIndex(model_name='project', name='crm_project_currency_idx'),
+        migrations.RemoveIndex(model_name='project', name='crm_project_open_due_idx'),
+        migrations.RemoveField(model_name='project', name='status'),
+        migrations.RemoveField(model_name='project', name='payment_status'),
+        migrations.RemoveField(model_name='project', name='payment_currency'),
+        migrations.RenameField(model_name='project', old_name='status_code', new_name='status'),
+        migrations.RenameField(model_name='project', old_name='payment_status_code', new_name='payment_status'),
+        migrations.RenameField(model_name='project', old_name='payment_currency_code', new_name='payment_currency'),
+        migrations.AlterField(
+            model_name='project',
+            name='status',
+            field=crm.fields.EnumCodeField(aliases={'canceled': 'cancelled', 'complete': 'completed', 'done': 'completed', 'finished': 'completed', 'in progress': 'active', 'in-progress': 'active', 'on hold': 'on-hold', 'ongoing': 'active', 'onhold': 'on-hold', 'open': 'active', 'paused': 'on-hold'}, choices=[('active', 'Active'), ('on-hold', 'On hold'), ('completed', 'Completed'), ('cancelled', 'Cancelled')], codes={'active': 1, 'cancelled': 4, 'completed': 3, 'on-hold': 2}, default='active'),
+        ),
+        migrations.AlterField(
+            model_name='project',
+            name='payment_status',
+            field=crm.fields.EnumCodeField(choices=[('paid', 'Paid'), ('unpaid', 'Unpaid'), ('partial', 'Partially paid')], codes={'paid': 3, 'partial': 2, 'unpaid': 1}, default='unpaid'),
+        ),
+        migrations.AlterField(
+            model_name='project',
+            name='payment_currency',
+            field=crm.fields.EnumCodeField(choices=[('USD', 'USD - US Dollar'), ('KES', 'KES - Kenyan Shilling'), ('EUR', 'EUR - Euro'), ('GBP', 'GBP - British Pound')], codes={'EUR': 3, 'GBP': 4, 'KES': 2, 'USD': 1}, default='USD'),
+        ),
+        migrations.AddIndex(
+            model_name='project',
+            index=models.Index(fields=['owner', 'status'], name='crm_project_owner_status_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='project',
+            index=models.Index(fields=['owner', 'payment_status'], name='crm_project_owner_pay_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='project',
+            index=models.Index(fields=['payment_currency'], name='crm_project_currency_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='project',
+            index=models.Index(condition=models.Q(('due_date__isnull', False), models.Q(('status', 'completed'), _negated=True)), fields=['owner', 'due_date'], name='crm_project_open_due_idx'),
+        ),
+        migrations.RunPython(rebuild_revenue, migrations.RunPython.noop),
+    ]
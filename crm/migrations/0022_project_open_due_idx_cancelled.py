@@ -0,0 +1,23 @@
+# Generated by Django 5.2.4 on 2026-10-19 02:49
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('crm', '0021_project_admin_code_indexes'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='project',
+            name='crm_project_open_due_idx',
+        ),
+        migrations.AddIndex(
+            model_name='project',
+            index=models.Index(condition=models.Q(('due_date__isnull', False), models.Q(('status__in', ('completed', 'cancelled')), _negated=True)), fields=['owner', 'due_date'], name='crm_project_open_due_idx'),
+        ),
+    ]
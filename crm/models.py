@@ -1,7 +1,10 @@
 from decimal import Decimal
-from django.db import models
+from django.db import models, transaction
+from django.db.models.functions import Now
 from django.contrib.auth import get_user_model
 from django.utils import timezone
+from .fields import EnumCodeField
+from .normalize import client_keys
 #get_user_model() → Returns the active User model.
 
 User = get_user_model()
@@ -21,6 +24,37 @@ PAYMENT_CHOICES = [
         ("partial", "Partially paid"),
     ]
 
+STATUS_CHOICES = [
+    ("active", "Active"),
+    ("on-hold", "On hold"),
+    ("completed", "Completed"),
+    ("cancelled", "Cancelled"),
+]
+
+# Finished projects: never due, never reminded.
+CLOSED_STATUSES = ("completed", "cancelled")
+
+# Spellings that used to be stored as free text, mapped onto STATUS_CHOICES.
+STATUS_ALIASES = {
+    "ongoing": "active",
+    "in progress": "active",
+    "in-progress": "active",
+    "open": "active",
+    "on hold": "on-hold",
+    "onhold": "on-hold",
+    "paused": "on-hold",
+    "complete": "completed",
+    "done": "completed",
+    "finished": "completed",
+    "canceled": "cancelled",
+}
+
+# Small-integer codes Project stores instead of the strings above (see crm/fields.py).
+# These values are in the database: add new ones, never renumber.
+STATUS_CODES = {"active": 1, "on-hold": 2, "completed": 3, "cancelled": 4}
+PAYMENT_CODES = {"unpaid": 1, "partial": 2, "paid": 3}
+CURRENCY_CODES = {"USD": 1, "KES": 2, "EUR": 3, "GBP": 4}
+
 class Client(models.Model):
     #You’re creating a Python class (Client) that inherits from models.Model.
     #This inheritance is what gives your class all the database superpowers.
@@ -36,22 +70,168 @@ class Client(models.Model):
     phone = models.CharField(max_length=50)
     company = models.CharField(max_length=255, blank=True, default="")
     created_at = models.DateTimeField(auto_now_add=True)
+    # Hashed, normalized lookup keys for duplicate detection (crm/normalize.py).
+    # Recomputed in save(); "" when the source field is empty.
+    phone_key = models.CharField(max_length=16, blank=True, default="", editable=False)
+    email_key = models.CharField(max_length=16, blank=True, default="", editable=False)
+    company_key = models.CharField(max_length=16, blank=True, default="", editable=False)
+
+    class Meta:
+        indexes = [
+            models.Index(fields=["owner", "phone_key"], name="crm_client_phone_key_idx"),
+            models.Index(fields=["owner", "email_key"], name="crm_client_email_key_idx"),
+            models.Index(fields=["owner", "company_key"], name="crm_client_company_key_idx"),
+        ]
+
+    def __str__(self):
+        return self.name
+
+    def save(self, *args, **kwargs):
+        for field, key in client_keys(self.phone, self.email, self.company).items():
+            setattr(self, field, key)
+        update_fields = kwargs.get("update_fields")
+        if update_fields is not None:
+            kwargs["update_fields"] = {*update_fields, "phone_key", "email_key", "company_key"}
+        super().save(*args, **kwargs)
 
 class Project(models.Model):
     client = models.ForeignKey(Client, on_delete=models.CASCADE, related_name="projects")
+    # Denormalized copy of client.owner so tenant scoping is a single-table filter
+    # instead of a join to crm_client. Always derived from the client in save().
+    # Indexed through Meta.indexes below (owner first), so no separate FK index.
+    owner = models.ForeignKey(
+        User, on_delete=models.CASCADE, related_name="projects", db_index=False, editable=False
+    )
     title = models.CharField(max_length=200)
-    status = models.CharField( default="active")  # active/completed/on-hold
+    status = EnumCodeField(
+        choices=STATUS_CHOICES, codes=STATUS_CODES, aliases=STATUS_ALIASES, default="active"
+    )
    
     due_date = models.DateField(null=True, blank=True)
     start_date = models.DateField(auto_now_add=True, null=False, blank=False)
      # NEW field: currency (3-letter ISO code). default prevents migration prompt
-    payment_currency = models.CharField(max_length=3, choices=CURRENCY_CHOICES, default="USD")
+    payment_currency = EnumCodeField(choices=CURRENCY_CHOICES, codes=CURRENCY_CODES, default="USD")
 
 
-    payment_status = models.CharField(max_length=10, choices=PAYMENT_CHOICES, default="unpaid")
+    payment_status = EnumCodeField(choices=PAYMENT_CHOICES, codes=PAYMENT_CODES, default="unpaid")
 
 
     payment_amount = models.DecimalField(
         max_digits=10, decimal_places=2, default=Decimal("0.00")
     )
 
+    class Meta:
+        indexes = [
+            # Serves both "all my projects" (owner prefix) and ?client=<id> lookups.
+            models.Index(fields=["owner", "client"], name="crm_project_owner_client_idx"),
+            # Back ?status= / ?payment_status= on the API (tenant first).
+            models.Index(fields=["owner", "status"], name="crm_project_owner_status_idx"),
+            models.Index(fields=["owner", "payment_status"], name="crm_project_owner_pay_idx"),
+            # The admin's list filters, which span every owner.
+            models.Index(fields=["status"], name="crm_project_status_idx"),
+            models.Index(fields=["payment_status"], name="crm_project_pay_status_idx"),
+            models.Index(fields=["payment_currency"], name="crm_project_currency_idx"),
+            # Open projects by due date, for /api/projects/due/ and send_due_reminders.
+            # Partial: closed (completed / cancelled) projects never need a reminder,
+            # so they stay out.
+            models.Index(
+                fields=["owner", "due_date"],
+                condition=models.Q(due_date__isnull=False) & ~models.Q(status__in=CLOSED_STATUSES),
+                name="crm_project_open_due_idx",
+            ),
+        ]
+
+    def __str__(self):
+        return self.title
+
+    def save(self, *args, **kwargs):
+        # Keep owner in step with the client on create and when the client changes.
+        # self.client is usually already cached (assigned object / select_related),
+        # so this rarely costs a query.
+        if self.client_id is not None:
+            self.owner_id = self.client.owner_id
+        update_fields = kwargs.get("update_fields")
+        if update_fields is not None and "client" in update_fields:
+            kwargs["update_fields"] = {*update_fields, "owner"}
+        # One transaction for the save and its revenue signals: pre_save locks the
+        # old row, so two saves of the same project can't both subtract the same
+        # old amount from the MonthlyRevenue rollup.
+        with transaction.atomic():
+            super().save(*args, **kwargs)
+
+
+class MonthlyRevenue(models.Model):
+    # Precomputed rollup of Project.payment_amount per owner / month / currency /
+    # payment_status, so revenue charts read a handful of rows per month instead of
+    # aggregating every project on each request.
+    # Maintained incrementally by crm/signals.py and rebuilt by
+    # `python manage.py backfill_revenue`.
+    owner = models.ForeignKey(User, on_delete=models.CASCADE, related_name="revenue_rollups")
+    month = models.DateField()  # always the 1st day of the month
+    payment_currency = models.CharField(max_length=3, choices=CURRENCY_CHOICES)
+    payment_status = models.CharField(max_length=10, choices=PAYMENT_CHOICES)
+    project_count = models.IntegerField(default=0)
+    total_amount = models.DecimalField(max_digits=14, decimal_places=2, default=Decimal("0.00"))
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(
+                fields=["owner", "month", "payment_currency", "payment_status"],
+                name="crm_monthlyrevenue_unique_bucket",
+            ),
+        ]
+        # The unique constraint's index (owner, month, ...) also serves the
+        # owner + month range scans done by the report endpoint.
+
+
+class RevokedToken(models.Model):
+    # A single JWT (by jti) that must no longer be accepted: logged-out access and
+    # refresh tokens, and refresh tokens that were rotated. Append-only; workers pull
+    # new rows into their in-memory revocation list (crm/revocation.py).
+    jti = models.CharField(max_length=64, unique=True)
+    expires_at = models.DateTimeField(db_index=True)  # row is useless after the token expires
+    # Set by the DB clock on insert; workers pull rows by this (see RevocationList.sync).
+    created_at = models.DateTimeField(db_default=Now(), db_index=True, editable=False)
+
+
+class TokenCutoff(models.Model):
+    # "Every token this user was issued before not_before is dead" — written on
+    # password change. Append-only; the newest row per user wins.
+    user = models.ForeignKey(User, on_delete=models.CASCADE, related_name="token_cutoffs")
+    not_before = models.DateTimeField()
+    expires_at = models.DateTimeField(db_index=True)  # once every older token has expired
+    created_at = models.DateTimeField(db_default=Now(), db_index=True, editable=False)
+
+
+REMINDER_CHOICES = [
+    ("overdue", "Overdue"),
+    ("due_soon", "Due soon"),
+]
+
+
+class ReminderOutbox(models.Model):
+    # Reminders produced by `python manage.py send_due_reminders`, waiting to be
+    # delivered. One row per project / kind / due date, so re-running the job (or
+    # running two at once) never queues the same reminder twice.
+    owner = models.ForeignKey(User, on_delete=models.CASCADE, related_name="reminders")
+    project = models.ForeignKey(Project, on_delete=models.CASCADE, related_name="reminders")
+    kind = models.CharField(max_length=10, choices=REMINDER_CHOICES)
+    due_date = models.DateField()
+    created_at = models.DateTimeField(auto_now_add=True)
+    sent_at = models.DateTimeField(null=True, blank=True)
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(
+                fields=["project", "kind", "due_date"],
+                name="crm_reminderoutbox_unique_reminder",
+            ),
+        ]
+        indexes = [
+            # Pending reminders, oldest first, for whatever delivers them.
+            models.Index(
+                fields=["created_at"],
+                condition=models.Q(sent_at__isnull=True),
+                name="crm_reminder_pending_idx",
+            ),
+        ]
@@ -0,0 +1,59 @@
+# Normalization for duplicate-client detection.
+# Each value is reduced to a canonical form and then hashed to a fixed-width key
+# (see Client.phone_key / email_key / company_key). Two clients whose keys match
+# are duplicate candidates. Kept free of model imports so migrations can use it.
+import hashlib
+import re
+
+from django.conf import settings
+
+# Legal-form words that don't distinguish one company from another.
+COMPANY_SUFFIXES = {
+    "ltd", "limited", "inc", "incorporated", "llc", "llp", "plc", "co",
+    "company", "corp", "corporation", "gmbh", "sa", "bv", "pty",
+}
+
+
+def normalize_phone(value):
+    # E.164-ish: "+<country><number>". Local numbers starting with a single 0 get
+    # DEFAULT_PHONE_COUNTRY_CODE; "00" is treated as an international prefix.
+    value = (value or "").strip()
+    digits = re.sub(r"\D", "", value)
+    if not digits:
+        return ""
+    if value.startswith("+"):
+        return "+" + digits
+    if digits.startswith("00"):
+        return "+" + digits[2:]
+    country = getattr(settings, "DEFAULT_PHONE_COUNTRY_CODE", "")
+    if digits.startswith("0") and country:
+        return "+" + country + digits[1:]
+    return digits
+
+
+def normalize_email(value):
+    return (value or "").strip().lower()
+
+
+def normalize_company(value):
+    words = re.sub(r"[^\w\s]", " ", (value or "").lower()).split()
+    if words and words[0] == "the":
+        words = words[1:]
+    while words and words[-1] in COMPANY_SUFFIXES:
+        words = words[:-1]
+    return " ".join(words)
+
+
+def lookup_key(normalized):
+    # 16 hex chars (64-bit blake2b); "" means "nothing to match on".
+    if not normalized:
+        return ""
+    return hashlib.blake2b(normalized.encode(), digest_size=8).hexdigest()
+
+
+def client_keys(phone, email, company):
+    return {
+        "phone_key": lookup_key(normalize_phone(phone)),
+        "email_key": lookup_key(normalize_email(email)),
+        "company_key": lookup_key(normalize_company(company)),
+    }
@@ -0,0 +1,137 @@
+# Readiness probe for the load balancer (GET /api/ready/).
+# Unlike /api/health/ (liveness: "the process answers") this checks that this worker
+# can actually serve: DB round-trip and connection age, unapplied migrations, and
+# back-pressure (requests in flight on this worker's threads, backlog of the log queue).
+# Results are cached per worker for READINESS_CACHE_SECONDS, and the migration
+# check stops running once it has passed, so a probe is usually one SELECT 1.
+import logging
+import threading
+import time
+
+from django.conf import settings
+from django.db import DEFAULT_DB_ALIAS, connections
+from django.db.backends.signals import connection_created
+from django.db.migrations.executor import MigrationExecutor
+from django.dispatch import receiver
+
+from .log import QueuedStreamHandler
+
+OK, DEGRADED, UNAVAILABLE = "ok", "degraded", "unavailable"
+
+_lock = threading.Lock()
+_cached = None  # (expires_at monotonic, result)
+_in_flight = 0
+_migrations_applied = False  # once True, stays True for the life of the process
+
+
+@receiver(connection_created)
+def _remember_connect_time(sender, connection, **kwargs):
+    connection.crm_connected_at = time.monotonic()
+
+
+class InFlightMiddleware:
+    # Counts requests currently being handled by this worker process.
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        global _in_flight
+        with _lock:
+            _in_flight += 1
+        try:
+            return self.get_response(request)
+        finally:
+            with _lock:
+                _in_flight -= 1
+
+
+def reset():
+    global _cached, _migrations_applied
+    with _lock:
+        _cached = None
+        _migrations_applied = False
+
+
+def check_database():
+    connection = connections[DEFAULT_DB_ALIAS]
+    started = time.perf_counter()
+    try:
+        with connection.cursor() as cursor:
+            cursor.execute("SELECT 1")
+            cursor.fetchone()
+    except Exception as e:
+        # Drop the broken connection so the next request reconnects.
+        connection.close_if_unusable_or_obsolete()
+        return {"status": UNAVAILABLE, "error": e.__class__.__name__}
+    latency_ms = round((time.perf_counter() - started) * 1000, 2)
+
+    connected_at = getattr(connection, "crm_connected_at", None)
+    return {
+        "status": DEGRADED if latency_ms > settings.READINESS_DB_SLOW_MS else OK,
+        "latency_ms": latency_ms,
+        "connection_age_s": round(time.monotonic() - connected_at, 1) if connected_at else None,
+    }
+
+
+def check_migrations():
+    # Loading the migration graph and introspecting tables is the costly part of the
+    # probe. A process's code never gains migrations while it runs, so once none are
+    # pending the answer can't go back to "pending": skip it from then on.
+    global _migrations_applied
+    if _migrations_applied:
+        return {"status": OK, "pending": 0}
+    try:
+        executor = MigrationExecutor(connections[DEFAULT_DB_ALIAS])
+        pending = executor.migration_plan(executor.loader.graph.leaf_nodes())
+    except Exception as e:
+        return {"status": UNAVAILABLE, "error": e.__class__.__name__}
+    # Code running against an older schema will fail on the new columns.
+    if not pending:
+        _migrations_applied = True
+    return {"status": UNAVAILABLE if pending else OK, "pending": len(pending)}
+
+
+def check_back_pressure():
+    log_backlog = sum(
+        handler.queue.qsize()
+        for handler in logging.getLogger().handlers
+        if isinstance(handler, QueuedStreamHandler)
+    )
+    # A gunicorn worker runs at most WEB_THREADS requests at once, so with the
+    # default limit this means the probe got the worker's last free thread.
+    busy = (
+        _in_flight >= settings.READINESS_MAX_IN_FLIGHT
+        or log_backlog > settings.READINESS_MAX_LOG_BACKLOG
+    )
+    return {
+        "status": DEGRADED if busy else OK,
+        "in_flight": _in_flight,  # includes the probe itself
+        "log_backlog": log_backlog,
+    }
+
+
+def readiness():
+    # Returns {"status": ok|degraded|unavailable, "checks": {...}}, cached briefly.
+    global _cached
+    now = time.monotonic()
+    cached = _cached
+    if cached is not None and cached[0] > now:
+        return cached[1]
+
+    checks = {
+        "database": check_database(),
+        "migrations": check_migrations(),
+        "back_pressure": check_back_pressure(),
+    }
+    statuses = {check["status"] for check in checks.values()}
+    if UNAVAILABLE in statuses:
+        overall = UNAVAILABLE
+    elif DEGRADED in statuses:
+        overall = DEGRADED
+    else:
+        overall = OK
+    result = {"status": overall, "checks": checks}
+
+    with _lock:
+        _cached = (now + settings.READINESS_CACHE_SECONDS, result)
+    return result
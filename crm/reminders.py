@@ -0,0 +1,77 @@
+# Overdue / due-soon projects, shared by /api/projects/due/ and the
+# send_due_reminders command. Both filter exactly like the partial index
+# crm_project_open_due_idx (due_date set, status not in CLOSED_STATUSES) so it can be used.
+import time
+from datetime import timedelta
+
+from django.contrib.auth import get_user_model
+from django.db.models import Q
+
+from .models import CLOSED_STATUSES, Project, ReminderOutbox
+
+User = get_user_model()
+
+
+def open_due_projects(queryset, today, days):
+    # Open projects due up to `days` days from today, overdue ones included.
+    return (
+        queryset
+        .filter(due_date__isnull=False, due_date__lte=today + timedelta(days=days))
+        .filter(~Q(status__in=CLOSED_STATUSES))
+    )
+
+
+def reminder_kind(due_date, today):
+    return "overdue" if due_date < today else "due_soon"
+
+
+def queue_due_reminders(today, days, owner_batch=500, chunk_size=2000, time_limit=None, after_owner=0):
+    # Walks owners in primary-key order, `owner_batch` at a time, and writes one
+    # outbox row per due project. Memory stays bounded by chunk_size: projects are
+    # streamed with .iterator() and inserted in chunks with ignore_conflicts, which
+    # also makes concurrent or repeated runs harmless (unique project/kind/due_date).
+    # Returns (candidates, owner id to resume after, finished?). candidates counts
+    # the due projects offered to the outbox, including ones an earlier run already
+    # queued (ignore_conflicts can't tell them apart). time_limit is checked after
+    # every chunk, but only once an owner is completely queued, so a resumed run
+    # (after_owner=<returned id>) always gets further; it redoes at most one owner.
+    deadline = time.monotonic() + time_limit if time_limit else None
+    candidates = 0
+    last_owner = after_owner
+
+    while True:
+        owner_ids = list(
+            User.objects.filter(pk__gt=last_owner).order_by("pk").values_list("pk", flat=True)[:owner_batch]
+        )
+        if not owner_ids:
+            return candidates, last_owner, True
+
+        rows = (
+            open_due_projects(Project.objects.filter(owner_id__in=owner_ids), today, days)
+            .order_by("owner_id", "due_date")  # the partial index's own order
+            .values_list("id", "owner_id", "due_date")
+            .iterator(chunk_size=chunk_size)
+        )
+        batch = []
+        done_owner = last_owner  # every owner up to this one is fully queued
+        current_owner = None
+        for project_id, owner_id, due_date in rows:
+            if owner_id != current_owner:
+                if current_owner is not None:
+                    done_owner = current_owner
+                current_owner = owner_id
+            batch.append(ReminderOutbox(
+                owner_id=owner_id, project_id=project_id, due_date=due_date,
+                kind=reminder_kind(due_date, today),
+            ))
+            if len(batch) >= chunk_size:
+                candidates += len(ReminderOutbox.objects.bulk_create(batch, ignore_conflicts=True))
+                batch = []
+                if deadline is not None and time.monotonic() >= deadline and done_owner != last_owner:
+                    return candidates, done_owner, False
+        if batch:
+            candidates += len(ReminderOutbox.objects.bulk_create(batch, ignore_conflicts=True))
+
+        last_owner = owner_ids[-1]
+        if deadline is not None and time.monotonic() >= deadline:
+            return candidates, last_owner, False
@@ -0,0 +1,94 @@
+# Helpers for the MonthlyRevenue rollup table.
+# The rollup is keyed by (owner, month, currency, payment_status) and is kept up to
+# date incrementally from crm/signals.py; rebuild_revenue() recomputes it from
+# scratch (used by the backfill_revenue management command).
+from decimal import Decimal
+
+from django.db import IntegrityError, transaction
+from django.db.models import Count, F, Sum
+from django.db.models.functions import Coalesce, TruncMonth
+
+from .models import MonthlyRevenue, Project
+
+
+def billing_month(due_date, start_date):
+    # A project is billed in the month it is due; projects without a due date
+    # fall back to the month they started.
+    day = due_date or start_date
+    if day is None:
+        return None
+    return day.replace(day=1)
+
+
+def bump_revenue(owner_id, month, currency, payment_status, amount, count):
+    # Adds (or subtracts, for negative values) amount/count to a single bucket using
+    # an F() expression, so concurrent writers never lose an update.
+    if owner_id is None or month is None or (not amount and not count):
+        return
+
+    bucket = MonthlyRevenue.objects.filter(
+        owner_id=owner_id,
+        month=month,
+        payment_currency=currency,
+        payment_status=payment_status,
+    )
+    updated = bucket.update(
+        total_amount=F("total_amount") + amount,
+        project_count=F("project_count") + count,
+    )
+    if updated or count < 0:
+        # Decrements never create rows: if the bucket is gone (e.g. the owner is
+        # being deleted) there is nothing to subtract from.
+        return
+
+    try:
+        with transaction.atomic():
+            MonthlyRevenue.objects.create(
+                owner_id=owner_id,
+                month=month,
+                payment_currency=currency,
+                payment_status=payment_status,
+                project_count=count,
+                total_amount=amount,
+            )
+    except IntegrityError:
+        # Another writer created the bucket between our UPDATE and INSERT.
+        bucket.update(
+            total_amount=F("total_amount") + amount,
+            project_count=F("project_count") + count,
+        )
+
+
+def rebuild_revenue(owner_id=None):
+    # Recomputes the rollup straight from Project rows with one GROUP BY query.
+    projects = Project.objects.all()
+    rollups = MonthlyRevenue.objects.all()
+    if owner_id is not None:
+        projects = projects.filter(owner_id=owner_id)
+        rollups = rollups.filter(owner_id=owner_id)
+
+    rows = (
+        projects
+        .annotate(month=TruncMonth(Coalesce("due_date", "start_date")))
+        .values("owner_id", "month", "payment_currency", "payment_status")
+        .annotate(project_count=Count("id"), total_amount=Sum("payment_amount"))
+        .order_by()
+    )
+
+    with transaction.atomic():
+        rollups.delete()
+        MonthlyRevenue.objects.bulk_create(
+            [
+                MonthlyRevenue(
+                    owner_id=row["owner_id"],
+                    month=row["month"],
+                    payment_currency=row["payment_currency"],
+                    payment_status=row["payment_status"],
+                    project_count=row["project_count"],
+                    total_amount=row["total_amount"] or Decimal("0.00"),
+                )
+                for row in rows
+            ],
+            batch_size=1000,
+        )
+    return len(rows)
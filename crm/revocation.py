@@ -0,0 +1,182 @@
+# In-memory JWT revocation list.
+# Checking a token must not cost a DB query, so each worker keeps:
+#   - a Bloom filter of revoked jtis → almost every (not revoked) token is cleared
+#     with a few bit lookups,
+#   - a jti → exp dict (the "TTL set") that confirms Bloom hits and lets expired
+#     entries drop out,
+#   - user_id → not_before cutoffs written on password change.
+# RevokedToken / TokenCutoff rows are the shared source of truth: a worker loads them
+# on first use and then, at most every REVOCATION_SYNC_SECONDS, pulls rows created
+# since the newest one it has seen minus an overlap window. Ids and created_at are
+# assigned at insert, not commit, so a row can become visible after newer ones; the
+# overlap catches those, and a full reload every REVOCATION_FULL_SYNC_SECONDS catches
+# anything older. Rows already loaded are skipped. Revocations made by a worker apply
+# to it immediately.
+import hashlib
+import math
+import threading
+import time
+from datetime import datetime, timedelta, timezone as dt_timezone
+
+from django.conf import settings
+from django.utils import timezone
+from rest_framework_simplejwt.settings import api_settings
+
+from .models import RevokedToken, TokenCutoff
+
+
+class BloomFilter:
+    def __init__(self, capacity, error_rate=0.001):
+        self.size = max(8, int(-capacity * math.log(error_rate) / math.log(2) ** 2))
+        self.hashes = max(1, round(self.size / capacity * math.log(2)))
+        self.bits = bytearray((self.size + 7) // 8)
+
+    def _positions(self, value):
+        # Double hashing: two 64-bit halves of one blake2b digest give k positions.
+        digest = hashlib.blake2b(value.encode(), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], "little")
+        h2 = int.from_bytes(digest[8:], "little") | 1
+        return ((h1 + i * h2) % self.size for i in range(self.hashes))
+
+    def add(self, value):
+        for pos in self._positions(value):
+            self.bits[pos >> 3] |= 1 << (pos & 7)
+
+    def __contains__(self, value):
+        return all(self.bits[pos >> 3] & (1 << (pos & 7)) for pos in self._positions(value))
+
+
+def _epoch(dt):
+    return int(dt.timestamp())
+
+
+def _datetime(epoch):
+    return datetime.fromtimestamp(epoch, tz=dt_timezone.utc)
+
+
+class RevocationList:
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self):
+        # Forget everything; the next check reloads from the DB.
+        with self._lock:
+            self._bloom = BloomFilter(settings.REVOCATION_BLOOM_CAPACITY)
+            self._bloom_entries = 0
+            self._jtis = {}
+            self._cutoffs = {}
+            self._newest_row = None  # created_at of the newest row pulled (DB clock)
+            self._synced_at = None
+            self._full_synced_at = None
+
+    # ── reads ─────────────────────────────────────────────────────────────
+    def is_revoked(self, token):
+        self.sync()
+        now = time.time()
+        jti = token.get(api_settings.JTI_CLAIM)
+        if jti and jti in self._bloom and self._jtis.get(jti, 0) > now:
+            return True
+        # iat and cutoffs are whole seconds, so a token issued in the same second as
+        # the password change can't be told apart from one issued just before it:
+        # it is revoked too (<=), at worst costing a fresh login.
+        cutoff = self._cutoffs.get(str(token.get(api_settings.USER_ID_CLAIM)))
+        return cutoff is not None and token.get("iat", 0) <= cutoff
+
+    def sync(self, force=False):
+        synced_at = self._synced_at
+        if not force and synced_at is not None and time.monotonic() - synced_at < settings.REVOCATION_SYNC_SECONDS:
+            return
+        # Only the first load makes other threads wait. After that one thread
+        # refreshes while the rest keep checking against the current snapshot,
+        # so a slow full reload never stalls authentication for the whole worker.
+        if not self._lock.acquire(blocking=synced_at is None or force):
+            return
+        try:
+            if not force and self._synced_at is not synced_at:
+                return  # another thread synced while we waited
+            self._pull()
+        finally:
+            self._lock.release()
+
+    def _pull(self):
+        # Called with the lock held.
+        now = timezone.now()
+        tokens = RevokedToken.objects.filter(expires_at__gt=now)
+        cutoffs = TokenCutoff.objects.filter(expires_at__gt=now)
+        full = (
+            self._full_synced_at is None
+            or time.monotonic() - self._full_synced_at >= settings.REVOCATION_FULL_SYNC_SECONDS
+        )
+        if not full and self._newest_row is not None:
+            since = self._newest_row - timedelta(seconds=settings.REVOCATION_SYNC_OVERLAP_SECONDS)
+            tokens = tokens.filter(created_at__gte=since)
+            cutoffs = cutoffs.filter(created_at__gte=since)
+
+        for created_at, jti, expires_at in tokens.values_list("created_at", "jti", "expires_at"):
+            if jti not in self._jtis:
+                self._add_jti(jti, _epoch(expires_at))
+            self._see_row(created_at)
+        for created_at, user_id, not_before in cutoffs.values_list("created_at", "user_id", "not_before"):
+            self._add_cutoff(user_id, _epoch(not_before))  # keeps the newest; repeats are harmless
+            self._see_row(created_at)
+        self._drop_expired()
+        self._synced_at = time.monotonic()
+        if full:
+            self._full_synced_at = self._synced_at
+
+    # ── writes ────────────────────────────────────────────────────────────
+    def revoke(self, token):
+        # Returns True if this call revoked the token, False if it already was
+        # (or has expired anyway).
+        jti, exp = token.get(api_settings.JTI_CLAIM), token.get("exp")
+        if not jti or not exp or exp <= time.time():
+            return False
+        _, created = RevokedToken.objects.get_or_create(jti=jti, defaults={"expires_at": _datetime(exp)})
+        with self._lock:
+            self._add_jti(jti, exp)
+        return created
+
+    def revoke_user(self, user_id):
+        # Kills every token issued to the user up to now (password change).
+        now = timezone.now()
+        lifetime = max(api_settings.ACCESS_TOKEN_LIFETIME, api_settings.REFRESH_TOKEN_LIFETIME)
+        TokenCutoff.objects.create(user_id=user_id, not_before=now, expires_at=now + lifetime)
+        with self._lock:
+            self._add_cutoff(user_id, _epoch(now))
+
+    # ── internals (call with the lock held; is_revoked reads without it) ──
+    def _add_jti(self, jti, exp):
+        if jti not in self._jtis:
+            self._bloom.add(jti)
+            self._bloom_entries += 1
+        self._jtis[jti] = exp
+
+    def _see_row(self, created_at):
+        if self._newest_row is None or created_at > self._newest_row:
+            self._newest_row = created_at
+
+    def _add_cutoff(self, user_id, not_before):
+        key = str(user_id)
+        self._cutoffs[key] = max(self._cutoffs.get(key, 0), not_before)
+
+    def _drop_expired(self):
+        now = time.time()
+        for jti in [jti for jti, exp in self._jtis.items() if exp <= now]:
+            del self._jtis[jti]
+
+        lifetime = max(api_settings.ACCESS_TOKEN_LIFETIME, api_settings.REFRESH_TOKEN_LIFETIME)
+        oldest = now - lifetime.total_seconds()
+        for user_id in [u for u, not_before in self._cutoffs.items() if not_before <= oldest]:
+            del self._cutoffs[user_id]
+
+        if len(self._jtis) < self._bloom_entries // 2:
+            # Bloom filters can't delete; rebuild once half the entries have expired.
+            # Built aside and swapped in whole: other threads read it without the lock.
+            bloom = BloomFilter(settings.REVOCATION_BLOOM_CAPACITY)
+            for jti in self._jtis:
+                bloom.add(jti)
+            self._bloom, self._bloom_entries = bloom, len(self._jtis)
+
+
+revocations = RevocationList()
@@ -14,23 +14,51 @@ class ClientSerializer(serializers.ModelSerializer):
         # Meta is Django’s convention for passing model-related settings to a
         #  class — it keeps things clean and readable.
         model = Client
-        fields = "__all__"
-        # fields = "__all__" → Include all fields from the model in the serializer output.
+        exclude = ("phone_key", "email_key", "company_key")
+        # exclude → Include every model field except the internal duplicate-lookup keys.
         read_only_fields = ("owner", "created_at")
         # read_only_fields → Prevent clients from manually setting these when posting data.
 
 
+class ClientMergeSerializer(serializers.Serializer):
+    # Body for POST /api/clients/<id>/merge/: the clients to fold into <id>.
+    duplicates = serializers.ListField(child=serializers.IntegerField(), allow_empty=False)
+
+
+class EnumChoiceField(serializers.ChoiceField):
+    # ChoiceField for an EnumCodeField: also accepts the spellings the model field
+    # normalizes (any case, aliases like "ongoing" → "active").
+    def __init__(self, model_field, **kwargs):
+        self.model_field = model_field
+        super().__init__(choices=model_field.choices, **kwargs)
+
+    def to_internal_value(self, data):
+        return super().to_internal_value(self.model_field.normalize(data))
+
+
 class ProjectSerializer(serializers.ModelSerializer):
     # Extra fields beyond the model:
     #   client_name → human-readable name of the client
     #   client_id → the FK id for linking back to Client
     client_name = serializers.CharField(source="client.name", read_only=True)
     client_id = serializers.IntegerField(source="client.id", read_only=True)
+    status = EnumChoiceField(Project._meta.get_field("status"), required=False)
+    payment_status = EnumChoiceField(Project._meta.get_field("payment_status"), required=False)
+    payment_currency = EnumChoiceField(Project._meta.get_field("payment_currency"), required=False)
 
     class Meta:
         model = Project
         fields = "__all__"
         # fields = "__all__" ensures all Project fields are included
         # plus the extra client_name + client_id we defined above.
+        read_only_fields = ("owner",)
+        # owner is copied from the client by Project.save(), never taken from input.
+
+    def validate_client(self, value):
+        # A project can only be created for (or moved to) one of your own clients.
+        request = self.context.get("request")
+        if request is not None and value.owner_id != request.user.id:
+            raise serializers.ValidationError("Client not found.")
+        return value
 
 
@@ -0,0 +1,94 @@
+# Keeps the MonthlyRevenue rollup (and Project.owner) in sync with writes, and
+# revokes a user's tokens when their password changes.
+# Connected in CrmConfig.ready() (crm/apps.py).
+from django.contrib.auth import get_user_model
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save, pre_save
+from django.dispatch import receiver
+
+from .models import Client, Project
+from .reports import billing_month, bump_revenue, rebuild_revenue
+from .revocation import revocations
+
+User = get_user_model()
+
+
+def _revenue_key(owner_id, due_date, start_date, currency, payment_status, amount):
+    return (owner_id, billing_month(due_date, start_date), currency, payment_status, amount)
+
+
+@receiver(pre_save, sender=Project)
+def remember_old_revenue(sender, instance, raw=False, **kwargs):
+    # Grab the row as it is in the DB so post_save can subtract the old contribution.
+    # Project.save() runs inside transaction.atomic(), so the row stays locked until
+    # post_save has bumped the rollup; a concurrent save waits and then reads our
+    # committed values.
+    instance._revenue_old = None
+    if raw or instance.pk is None:
+        return
+    old = (
+        Project.objects
+        .select_for_update()
+        .filter(pk=instance.pk)
+        .values_list(
+            "owner_id", "due_date", "start_date",
+            "payment_currency", "payment_status", "payment_amount",
+        )
+        .first()
+    )
+    if old:
+        instance._revenue_old = _revenue_key(*old)
+
+
+@receiver(post_save, sender=Project)
+def update_revenue_on_save(sender, instance, raw=False, **kwargs):
+    if raw:
+        return
+    new = _revenue_key(
+        instance.owner_id, instance.due_date, instance.start_date,
+        instance.payment_currency, instance.payment_status, instance.payment_amount,
+    )
+    old = getattr(instance, "_revenue_old", None)
+    if old == new:
+        return
+
+    # Already inside Project.save()'s transaction.
+    if old:
+        bump_revenue(*old[:4], amount=-old[4], count=-1)
+    bump_revenue(*new[:4], amount=new[4], count=1)
+
+
+@receiver(post_delete, sender=Project)
+def update_revenue_on_delete(sender, instance, **kwargs):
+    bump_revenue(
+        instance.owner_id,
+        billing_month(instance.due_date, instance.start_date),
+        instance.payment_currency,
+        instance.payment_status,
+        amount=-instance.payment_amount,
+        count=-1,
+    )
+
+
+@receiver(post_save, sender=Client)
+def sync_project_owner(sender, instance, created, raw=False, **kwargs):
+    # When a client is handed to another user its projects (and their revenue)
+    # follow it. Just one indexed SELECT when the owner didn't change.
+    if created or raw:
+        return
+    stale = instance.projects.exclude(owner_id=instance.owner_id)
+    previous_owners = set(stale.values_list("owner_id", flat=True))
+    if not previous_owners:
+        return
+    with transaction.atomic():
+        stale.update(owner_id=instance.owner_id)
+        for owner_id in previous_owners | {instance.owner_id}:
+            rebuild_revenue(owner_id=owner_id)
+
+
+@receiver(post_save, sender=User)
+def revoke_tokens_on_password_change(sender, instance, created, raw=False, **kwargs):
+    # set_password() leaves the new raw password in _password until save() is done.
+    if created or raw or getattr(instance, "_password", None) is None:
+        return
+    revocations.revoke_user(instance.pk)
@@ -0,0 +1,16 @@
+-- query 1
+SELECT "django_session"."session_key", "django_session"."session_data", "django_session"."expire_date" FROM "django_session" WHERE ("django_session"."expire_date" > ? AND "django_session"."session_key" = ?) LIMIT ?
+   plan: SEARCH django_session USING INDEX sqlite_autoindex_django_session_1 (session_key=?)
+-- query 2
+SELECT "auth_user"."id", "auth_user"."password", "auth_user"."last_login", "auth_user"."is_superuser", "auth_user"."username", "auth_user"."first_name", "auth_user"."last_name", "auth_user"."email", "auth_user"."is_staff", "auth_user"."is_active", "auth_user"."date_joined" FROM "auth_user" WHERE "auth_user"."id" = ? LIMIT ?
+   plan: SEARCH auth_user USING INTEGER PRIMARY KEY (rowid=?)
+-- query 3
+SELECT COUNT(*) FROM (SELECT "crm_project"."id" AS "col1" FROM "crm_project" WHERE "crm_project"."status" = ? ORDER BY "crm_project"."id" DESC LIMIT ?) subquery
+   plan: CO-ROUTINE subquery
+   plan: SEARCH crm_project USING COVERING INDEX crm_project_status_idx (status=?)
+   plan: SCAN subquery
+-- query 4
+SELECT "crm_project"."id", "crm_project"."client_id", "crm_project"."owner_id", "crm_project"."title", "crm_project"."status", "crm_project"."due_date", "crm_project"."start_date", "crm_project"."payment_currency", "crm_project"."payment_status", "crm_project"."payment_amount", "crm_client"."id", "crm_client"."owner_id", "crm_client"."name", "crm_client"."email", "crm_client"."phone", "crm_client"."company", "crm_client"."created_at", "crm_client"."phone_key", "crm_client"."email_key", "crm_client"."company_key", "auth_user"."id", "auth_user"."password", "auth_user"."last_login", "auth_user"."is_superuser", "auth_user"."username", "auth_user"."first_name", "auth_user"."last_name", "auth_user"."email", "auth_user"."is_staff", "auth_user"."is_active", "auth_user"."date_joined" FROM "crm_project" INNER JOIN "crm_client" ON ("crm_project"."client_id" = "crm_client"."id") INNER JOIN "auth_user" ON ("crm_project"."owner_id" = "auth_user"."id") WHERE "crm_project"."status" = ? ORDER BY "crm_project"."id" DESC LIMIT ?
+   plan: SEARCH crm_project USING INDEX crm_project_status_idx (status=?)
+   plan: SEARCH crm_client USING INTEGER PRIMARY KEY (rowid=?)
+   plan: SEARCH auth_user USING INTEGER PRIMARY KEY (rowid=?)
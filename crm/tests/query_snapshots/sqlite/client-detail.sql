@@ -0,0 +1,3 @@
+-- query 1
+SELECT "crm_client"."id", "crm_client"."owner_id", "crm_client"."name", "crm_client"."email", "crm_client"."phone", "crm_client"."company", "crm_client"."created_at", "crm_client"."phone_key", "crm_client"."email_key", "crm_client"."company_key" FROM "crm_client" WHERE ("crm_client"."owner_id" = ? AND "crm_client"."id" = ?) LIMIT ?
+   plan: SEARCH crm_client USING INTEGER PRIMARY KEY (rowid=?)
@@ -0,0 +1,18 @@
+-- query 1
+SELECT "crm_client"."id" AS "id", "crm_client"."phone_key" AS "phone_key" FROM "crm_client" WHERE ("crm_client"."owner_id" = ? AND "crm_client"."phone_key" IN (SELECT U0."phone_key" AS "phone_key" FROM "crm_client" U0 WHERE (U0."owner_id" = ? AND NOT (U0."phone_key" = ?)) GROUP BY ? HAVING COUNT(U0."id") > ?))
+   plan: SEARCH crm_client USING COVERING INDEX crm_client_phone_key_idx (owner_id=? AND phone_key=?)
+   plan: LIST SUBQUERY ?
+   plan: SEARCH U0 USING COVERING INDEX crm_client_phone_key_idx (owner_id=?)
+-- query 2
+SELECT "crm_client"."id" AS "id", "crm_client"."email_key" AS "email_key" FROM "crm_client" WHERE ("crm_client"."owner_id" = ? AND "crm_client"."email_key" IN (SELECT U0."email_key" AS "email_key" FROM "crm_client" U0 WHERE (U0."owner_id" = ? AND NOT (U0."email_key" = ?)) GROUP BY ? HAVING COUNT(U0."id") > ?))
+   plan: SEARCH crm_client USING COVERING INDEX crm_client_email_key_idx (owner_id=? AND email_key=?)
+   plan: LIST SUBQUERY ?
+   plan: SEARCH U0 USING COVERING INDEX crm_client_email_key_idx (owner_id=?)
+-- query 3
+SELECT "crm_client"."id" AS "id", "crm_client"."company_key" AS "company_key" FROM "crm_client" WHERE ("crm_client"."owner_id" = ? AND "crm_client"."company_key" IN (SELECT U0."company_key" AS "company_key" FROM "crm_client" U0 WHERE (U0."owner_id" = ? AND NOT (U0."company_key" = ?)) GROUP BY ? HAVING COUNT(U0."id") > ?))
+   plan: SEARCH crm_client USING COVERING INDEX crm_client_company_key_idx (owner_id=? AND company_key=?)
+   plan: LIST SUBQUERY ?
+   plan: SEARCH U0 USING COVERING INDEX crm_client_company_key_idx (owner_id=?)
+-- query 4
+SELECT "crm_client"."id", "crm_client"."owner_id", "crm_client"."name", "crm_client"."email", "crm_client"."phone", "crm_client"."company", "crm_client"."created_at", "crm_client"."phone_key", "crm_client"."email_key", "crm_client"."company_key" FROM "crm_client" WHERE ("crm_client"."owner_id" = ? AND "crm_client"."id" IN (?, ?))
+   plan: SEARCH crm_client USING INTEGER PRIMARY KEY (rowid=?)
@@ -0,0 +1,20 @@
+-- query 1
+SELECT "crm_client"."id", "crm_client"."owner_id", "crm_client"."name", "crm_client"."email", "crm_client"."phone", "crm_client"."company", "crm_client"."created_at", "crm_client"."phone_key", "crm_client"."email_key", "crm_client"."company_key" FROM "crm_client" WHERE ("crm_client"."owner_id" = ? AND "crm_client"."id" = ?) LIMIT ?
+   plan: SEARCH crm_client USING INTEGER PRIMARY KEY (rowid=?)
+-- query 2
+SELECT "crm_client"."id" AS "id" FROM "crm_client" WHERE ("crm_client"."owner_id" = ? AND "crm_client"."id" IN (?)) ORDER BY "crm_client"."created_at" DESC
+   plan: SEARCH crm_client USING INTEGER PRIMARY KEY (rowid=?)
+-- query 3
+SAVEPOINT "<savepoint>"
+-- query 4
+UPDATE "crm_project" SET "client_id" = ? WHERE "crm_project"."client_id" IN (?)
+-- query 5
+SELECT "crm_client"."id", "crm_client"."owner_id", "crm_client"."name", "crm_client"."email", "crm_client"."phone", "crm_client"."company", "crm_client"."created_at", "crm_client"."phone_key", "crm_client"."email_key", "crm_client"."company_key" FROM "crm_client" WHERE "crm_client"."id" IN (?)
+   plan: SEARCH crm_client USING INTEGER PRIMARY KEY (rowid=?)
+-- query 6
+SELECT "crm_project"."id", "crm_project"."client_id", "crm_project"."owner_id", "crm_project"."title", "crm_project"."status", "crm_project"."due_date", "crm_project"."start_date", "crm_project"."payment_currency", "crm_project"."payment_status", "crm_project"."payment_amount" FROM "crm_project" WHERE "crm_project"."client_id" IN (?)
+   plan: SEARCH crm_project USING INDEX crm_project_client_id_08e45c53 (client_id=?)
+-- query 7
+DELETE FROM "crm_client" WHERE "crm_client"."id" IN (?)
+-- query 8
+RELEASE SAVEPOINT "<savepoint>"
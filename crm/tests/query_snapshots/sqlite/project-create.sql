@@ -0,0 +1,17 @@
+-- query 1
+SELECT "crm_client"."id", "crm_client"."owner_id", "crm_client"."name", "crm_client"."email", "crm_client"."phone", "crm_client"."company", "crm_client"."created_at", "crm_client"."phone_key", "crm_client"."email_key", "crm_client"."company_key" FROM "crm_client" WHERE "crm_client"."id" = ? LIMIT ?
+   plan: SEARCH crm_client USING INTEGER PRIMARY KEY (rowid=?)
+-- query 2
+SAVEPOINT "<savepoint>"
+-- query 3
+INSERT INTO "crm_project" ("client_id", "owner_id", "title", "status", "due_date", "start_date", "payment_currency", "payment_status", "payment_amount") VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?) RETURNING "crm_project"."id"
+-- query 4
+UPDATE "crm_monthlyrevenue" SET "total_amount" = (CAST(("crm_monthlyrevenue"."total_amount" + (CAST(? AS NUMERIC))) AS NUMERIC)), "project_count" = ("crm_monthlyrevenue"."project_count" + ?) WHERE ("crm_monthlyrevenue"."month" = ? AND "crm_monthlyrevenue"."owner_id" = ? AND "crm_monthlyrevenue"."payment_currency" = ? AND "crm_monthlyrevenue"."payment_status" = ?)
+-- query 5
+SAVEPOINT "<savepoint>"
+-- query 6
+INSERT INTO "crm_monthlyrevenue" ("owner_id", "month", "payment_currency", "payment_status", "project_count", "total_amount") VALUES (?, ?, ?, ?, ?, ?) RETURNING "crm_monthlyrevenue"."id"
+-- query 7
+RELEASE SAVEPOINT "<savepoint>"
+-- query 8
+RELEASE SAVEPOINT "<savepoint>"
@@ -0,0 +1,4 @@
+-- query 1
+SELECT "crm_project"."id", "crm_project"."client_id", "crm_project"."owner_id", "crm_project"."title", "crm_project"."status", "crm_project"."due_date", "crm_project"."start_date", "crm_project"."payment_currency", "crm_project"."payment_status", "crm_project"."payment_amount", "crm_client"."id", "crm_client"."owner_id", "crm_client"."name", "crm_client"."email", "crm_client"."phone", "crm_client"."company", "crm_client"."created_at", "crm_client"."phone_key", "crm_client"."email_key", "crm_client"."company_key" FROM "crm_project" INNER JOIN "crm_client" ON ("crm_project"."client_id" = "crm_client"."id") WHERE ("crm_project"."owner_id" = ? AND "crm_project"."client_id" = ?)
+   plan: SEARCH crm_client USING INTEGER PRIMARY KEY (rowid=?)
+   plan: SEARCH crm_project USING INDEX crm_project_owner_client_idx (owner_id=? AND client_id=?)
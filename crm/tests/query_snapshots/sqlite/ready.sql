@@ -0,0 +1,3 @@
+-- query 1
+SELECT ?
+   plan: SCAN CONSTANT ROW
@@ -0,0 +1,8 @@
+-- query 1
+SELECT ? AS "a" FROM "auth_user" WHERE "auth_user"."username" = ? LIMIT ?
+   plan: SEARCH auth_user USING COVERING INDEX sqlite_autoindex_auth_user_1 (username=?)
+-- query 2
+SELECT ? AS "a" FROM "auth_user" WHERE "auth_user"."username" LIKE ? ESCAPE ? LIMIT ?
+   plan: SCAN auth_user USING COVERING INDEX sqlite_autoindex_auth_user_1
+-- query 3
+INSERT INTO "auth_user" ("password", "last_login", "is_superuser", "username", "first_name", "last_name", "email", "is_staff", "is_active", "date_joined") VALUES (?, NULL, ?, ?, ?, ?, ?, ?, ?, ?) RETURNING "auth_user"."id"
@@ -0,0 +1,3 @@
+-- query 1
+SELECT "crm_monthlyrevenue"."month" AS "month", "crm_monthlyrevenue"."payment_currency" AS "payment_currency", "crm_monthlyrevenue"."payment_status" AS "payment_status", "crm_monthlyrevenue"."project_count" AS "project_count", "crm_monthlyrevenue"."total_amount" AS "total_amount" FROM "crm_monthlyrevenue" WHERE ("crm_monthlyrevenue"."month" >= ? AND "crm_monthlyrevenue"."month" <= ? AND "crm_monthlyrevenue"."owner_id" = ? AND "crm_monthlyrevenue"."project_count" > ?) ORDER BY ? ASC, ? ASC
+   plan: SEARCH crm_monthlyrevenue USING INDEX sqlite_autoindex_crm_monthlyrevenue_1 (owner_id=? AND month>? AND month<?)
@@ -1,7 +1,15 @@
+import threading
+from datetime import timedelta
 import pytest
 from django.urls import reverse
 from rest_framework.test import APIClient
 from django.contrib.auth import get_user_model
+from django.utils import timezone
+from rest_framework_simplejwt.tokens import RefreshToken
+from rest_framework_simplejwt.exceptions import InvalidToken
+from crm.auth import RotatingTokenRefreshSerializer
+from crm.models import RevokedToken, TokenCutoff
+from crm.revocation import revocations
 
 User = get_user_model()
 
@@ -114,3 +122,150 @@ def test_token_refresh():
 
     assert refresh_resp.status_code == 200
     assert "access" in refresh_resp.data
+
+
+# ✅ REVOCATION / ROTATION TESTS
+@pytest.fixture
+def fresh_revocations():
+    revocations.reset()
+    yield revocations
+    revocations.reset()
+
+
+def _login(client, username):
+    User.objects.create_user(username=username, password="pass1234")
+    resp = client.post(reverse("token_obtain_pair"),
+                       {"username": username, "password": "pass1234"}, format="json")
+    assert resp.status_code == 200
+    return resp.data
+
+
+@pytest.mark.django_db
+def test_refresh_rotation_revokes_old_token(fresh_revocations):
+    client = APIClient()
+    tokens = _login(client, "rotateuser")
+
+    first = client.post(reverse("token_refresh"), {"refresh": tokens["refresh"]}, format="json")
+    assert first.status_code == 200
+    assert first.data["refresh"] != tokens["refresh"]
+
+    # Replaying the old refresh token is rejected
+    replay = client.post(reverse("token_refresh"), {"refresh": tokens["refresh"]}, format="json")
+    assert replay.status_code == 401
+
+    second = client.post(reverse("token_refresh"), {"refresh": first.data["refresh"]}, format="json")
+    assert second.status_code == 200
+
+
+@pytest.mark.django_db
+def test_logout_revokes_tokens(fresh_revocations):
+    client = APIClient()
+    tokens = _login(client, "logoutuser")
+    client.credentials(HTTP_AUTHORIZATION=f"Bearer {tokens['access']}")
+
+    assert client.get("/api/clients/").status_code == 200
+    resp = client.post(reverse("token_logout"), {"refresh": tokens["refresh"]}, format="json")
+    assert resp.status_code == 205
+
+    assert client.get("/api/clients/").status_code == 401
+    client.credentials()
+    refresh = client.post(reverse("token_refresh"), {"refresh": tokens["refresh"]}, format="json")
+    assert refresh.status_code == 401
+
+
+@pytest.mark.django_db
+def test_password_change_revokes_tokens(fresh_revocations):
+    client = APIClient()
+    tokens = _login(client, "pwuser")
+
+    user = User.objects.get(username="pwuser")
+    user.set_password("newpass5678")
+    user.save()
+
+    client.credentials(HTTP_AUTHORIZATION=f"Bearer {tokens['access']}")
+    assert client.get("/api/clients/").status_code == 401
+
+
+@pytest.mark.django_db
+def test_password_change_cutoff_boundary(fresh_revocations):
+    # iat has whole-second precision: a token from the same second as the change
+    # is revoked, one from the next second is not.
+    user = User.objects.create_user(username="edgeuser", password="pass1234")
+    fresh_revocations.revoke_user(user.pk)
+    cutoff = int(TokenCutoff.objects.get(user=user).not_before.timestamp())
+
+    same_second, next_second = RefreshToken.for_user(user), RefreshToken.for_user(user)
+    same_second["iat"] = cutoff
+    next_second["iat"] = cutoff + 1
+    assert fresh_revocations.is_revoked(same_second)
+    assert not fresh_revocations.is_revoked(next_second)
+
+
+@pytest.mark.django_db
+def test_concurrent_refresh_replay_is_rejected(fresh_revocations, settings):
+    # Another worker refreshed with the same token a moment ago: its RevokedToken row
+    # exists, but this worker's snapshot predates it, so is_revoked() still says no.
+    # Inserting the row is what decides, and this request loses.
+    settings.REVOCATION_SYNC_SECONDS = 60
+    user = User.objects.create_user(username="raceuser", password="pass1234")
+    token = RefreshToken.for_user(user)
+    assert not fresh_revocations.is_revoked(token)
+    RevokedToken.objects.create(jti=token["jti"], expires_at=timezone.now() + timedelta(days=1))
+
+    with pytest.raises(InvalidToken):
+        RotatingTokenRefreshSerializer().validate({"refresh": str(token)})
+
+
+@pytest.mark.django_db
+def test_revocations_reload_from_db(fresh_revocations):
+    user = User.objects.create_user(username="reloaduser", password="pass1234")
+    token = RefreshToken.for_user(user)
+    fresh_revocations.revoke(token)
+    assert RevokedToken.objects.filter(jti=token["jti"]).exists()
+
+    # A new worker starts with nothing in memory and picks the row up from the DB
+    fresh_revocations.reset()
+    assert fresh_revocations.is_revoked(token)
+
+
+@pytest.mark.django_db
+def test_revocations_pick_up_late_commits(fresh_revocations, settings):
+    # A row can commit after newer ones were already pulled: ids and created_at are
+    # assigned at insert. The overlap window and the periodic full reload catch it.
+    settings.REVOCATION_SYNC_SECONDS = 0
+    user = User.objects.create_user(username="lateuser", password="pass1234")
+    newer, late, very_late = (RefreshToken.for_user(user) for _ in range(3))
+    expires_at = timezone.now() + timedelta(days=1)
+    seen = RevokedToken.objects.create(id=100, jti=newer["jti"], expires_at=expires_at)
+    assert fresh_revocations.is_revoked(newer)
+
+    def commit_late(row_id, token, seconds_ago):
+        RevokedToken.objects.create(
+            id=row_id, jti=token["jti"], expires_at=expires_at,
+            created_at=RevokedToken.objects.get(pk=seen.pk).created_at - timedelta(seconds=seconds_ago),
+        )
+
+    commit_late(50, late, 5)
+    assert fresh_revocations.is_revoked(late)
+
+    commit_late(10, very_late, 3600)
+    assert not fresh_revocations.is_revoked(very_late)
+    settings.REVOCATION_FULL_SYNC_SECONDS = 0
+    assert fresh_revocations.is_revoked(very_late)
+
+
+@pytest.mark.django_db
+def test_revocation_checks_do_not_wait_for_a_running_sync(fresh_revocations, settings):
+    user = User.objects.create_user(username="busyuser", password="pass1234")
+    token = RefreshToken.for_user(user)
+    fresh_revocations.revoke(token)
+    assert fresh_revocations.is_revoked(token)  # first load done
+
+    settings.REVOCATION_SYNC_SECONDS = 0
+    results = []
+    with fresh_revocations._lock:  # another thread is in the middle of a pull
+        checker = threading.Thread(target=lambda: results.append(fresh_revocations.is_revoked(token)))
+        checker.start()
+        checker.join(timeout=2)
+        assert not checker.is_alive()
+    assert results == [True]  # answered from the current snapshot
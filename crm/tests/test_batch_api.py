@@ -0,0 +1,94 @@
+import pytest
+from django.urls import reverse
+from rest_framework.test import APIClient
+from django.contrib.auth import get_user_model
+from crm.models import Client, Project
+
+User = get_user_model()
+
+
+@pytest.mark.django_db
+def test_batch_runs_sub_requests():
+    user = User.objects.create_user(username="batch1", password="pass1234")
+    c1 = Client.objects.create(name="Client A", owner=user)
+    Project.objects.create(title="P1", status="ongoing", client=c1)
+
+    client = APIClient()
+    client.force_authenticate(user=user)
+
+    payload = {
+        "requests": [
+            {"id": "clients", "method": "GET", "path": "/api/clients/"},
+            {"id": "projects", "method": "GET", "path": f"/api/projects/?client={c1.id}"},
+            {"id": "health", "method": "GET", "path": "/api/health/"},
+            {"id": "missing", "method": "GET", "path": "/api/nope/"},
+        ]
+    }
+    response = client.post(reverse("batch"), payload, format="json")
+
+    assert response.status_code == 200
+    results = {item["id"]: item for item in response.data["responses"]}
+    assert results["clients"]["body"][0]["name"] == "Client A"
+    assert results["projects"]["body"][0]["title"] == "P1"
+    assert results["health"]["body"] == {"status": "ok"}
+    assert results["missing"]["status"] == 404
+
+
+@pytest.mark.django_db
+def test_batch_atomic_rolls_back_on_failure():
+    user = User.objects.create_user(username="batch2", password="pass1234")
+
+    client = APIClient()
+    client.force_authenticate(user=user)
+
+    payload = {
+        "atomic": True,
+        "requests": [
+            {"method": "POST", "path": "/api/clients/", "body": {"name": "Kept?", "phone": "0712"}},
+            {"method": "POST", "path": "/api/clients/", "body": {"phone": "0712"}},  # no name → 400
+        ],
+    }
+    response = client.post(reverse("batch"), payload, format="json")
+
+    assert response.status_code == 200
+    assert [item["status"] for item in response.data["responses"]] == [201, 400]
+    assert Client.objects.count() == 0
+
+
+@pytest.mark.django_db
+def test_batch_limits():
+    user = User.objects.create_user(username="batch3", password="pass1234")
+
+    client = APIClient()
+    client.force_authenticate(user=user)
+
+    too_many = {"requests": [{"path": "/api/clients/"}] * 100}
+    assert client.post(reverse("batch"), too_many, format="json").status_code == 400
+
+    parallel_write = {
+        "parallel": True,
+        "requests": [{"method": "POST", "path": "/api/clients/", "body": {"name": "X"}}],
+    }
+    assert client.post(reverse("batch"), parallel_write, format="json").status_code == 400
+
+    nested = {"requests": [{"path": "/api/batch/"}]}
+    response = client.post(reverse("batch"), nested, format="json")
+    assert response.data["responses"][0]["status"] == 404
+
+
+@pytest.mark.django_db(transaction=True)
+def test_batch_parallel_reads():
+    user = User.objects.create_user(username="batch4", password="pass1234")
+    Client.objects.create(name="Client A", owner=user)
+
+    client = APIClient()
+    client.force_authenticate(user=user)
+
+    payload = {
+        "parallel": True,
+        "requests": [{"id": str(i), "path": "/api/clients/"} for i in range(3)],
+    }
+    response = client.post(reverse("batch"), payload, format="json")
+
+    assert response.status_code == 200
+    assert [item["status"] for item in response.data["responses"]] == [200, 200, 200]
@@ -2,7 +2,7 @@
 import pytest
 from django.contrib.auth import get_user_model
 from rest_framework.test import APIClient
-from crm.models import Client
+from crm.models import Client, Project
 
 User = get_user_model()
 
@@ -43,4 +43,43 @@ def test_create_client():
 
     print(response.data)  # 👈 This will show exactly why it's failing
     assert response.status_code == 201
-    assert response.data["name"] == "New Client"
\ No newline at end of file
+    assert response.data["name"] == "New Client"
+
+@pytest.mark.django_db
+def test_find_duplicate_clients():
+    client = APIClient()
+    user = User.objects.create_user(username="dupuser", password="pass1234")
+    a = Client.objects.create(owner=user, name="Acme", phone="0712 345 678", company="Acme Ltd.")
+    b = Client.objects.create(owner=user, name="ACME", phone="+254712345678")
+    c = Client.objects.create(owner=user, name="Acme (billing)", company="the acme limited")
+    Client.objects.create(owner=user, name="Someone else", phone="0799000000")
+    client.force_authenticate(user=user)
+
+    response = client.get("/api/clients/duplicates/")
+
+    assert response.status_code == 200
+    assert len(response.data) == 1
+    group = response.data[0]
+    assert group["reasons"] == ["company", "phone"]
+    assert sorted(item["id"] for item in group["clients"]) == [a.id, b.id, c.id]
+
+
+@pytest.mark.django_db
+def test_merge_duplicate_clients():
+    client = APIClient()
+    user = User.objects.create_user(username="mergeuser", password="pass1234")
+    other = User.objects.create_user(username="otheruser", password="pass1234")
+    keep = Client.objects.create(owner=user, name="Acme", email="hi@acme.com")
+    dup = Client.objects.create(owner=user, name="Acme 2", email="HI@acme.com ")
+    foreign = Client.objects.create(owner=other, name="Not mine")
+    Project.objects.create(title="P1", client=dup)
+    client.force_authenticate(user=user)
+
+    response = client.post(f"/api/clients/{keep.id}/merge/", {"duplicates": [foreign.id]}, format="json")
+    assert response.status_code == 400
+
+    response = client.post(f"/api/clients/{keep.id}/merge/", {"duplicates": [dup.id]}, format="json")
+    assert response.status_code == 200
+    assert response.data["projects_moved"] == 1
+    assert not Client.objects.filter(id=dup.id).exists()
+    assert Project.objects.get(title="P1").client_id == keep.id
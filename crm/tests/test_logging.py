@@ -0,0 +1,61 @@
+import io
+import json
+import logging
+
+from django.urls import reverse
+from rest_framework.test import APIClient
+from crm.log import JsonFormatter, QueuedStreamHandler, RequestContextFilter, SampleFilter, request_id_var
+
+
+def test_queued_handler_writes_json_lines():
+    stream = io.StringIO()
+    handler = QueuedStreamHandler(stream)
+    handler.setFormatter(JsonFormatter())
+    handler.addFilter(RequestContextFilter())
+    logger = logging.getLogger("crm.tests.queued")
+    logger.addHandler(handler)
+    logger.propagate = False
+
+    token = request_id_var.set("abc123")
+    try:
+        logger.warning("hello %s", "world", extra={"duration_ms": 1.5})
+    finally:
+        request_id_var.reset(token)
+        logger.removeHandler(handler)
+        handler.close()  # waits for the listener thread to drain the queue
+
+    line = json.loads(stream.getvalue().splitlines()[0])
+    assert line["message"] == "hello world"
+    assert line["level"] == "WARNING"
+    assert line["request_id"] == "abc123"
+    assert line["duration_ms"] == 1.5
+
+
+def test_sample_filter_keeps_warnings():
+    sampler = SampleFilter(rate=0.0)
+    debug = logging.LogRecord("django.db.backends", logging.DEBUG, "", 0, "sql", None, None)
+    warning = logging.LogRecord("django.db.backends", logging.WARNING, "", 0, "slow", None, None)
+
+    assert not sampler.filter(debug)
+    assert sampler.filter(warning)
+
+
+def test_request_id_header():
+    client = APIClient()
+
+    response = client.get(reverse("health"), HTTP_X_REQUEST_ID="from-lb")
+    assert response["X-Request-ID"] == "from-lb"
+
+    response = client.get(reverse("health"))
+    assert len(response["X-Request-ID"]) == 32
+
+
+def test_django_loggers_use_the_queued_handler(settings):
+    # No second, synchronous handler from Django's default config; LOG_LEVEL applies.
+    for name in ("django", "django.server"):
+        logger = logging.getLogger(name)
+        kinds = [type(h) for h in logger.handlers]  # pytest adds its capture handlers too
+        assert QueuedStreamHandler in kinds
+        assert logging.StreamHandler not in kinds
+        assert logger.level == logging.getLevelName(settings.LOG_LEVEL)
+        assert not logger.propagate
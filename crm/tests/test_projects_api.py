@@ -1,8 +1,12 @@
 import pytest
+from datetime import timedelta
+from django.core.management import call_command
 from django.urls import reverse
+from django.utils import timezone
 from rest_framework.test import APIClient
 from django.contrib.auth import get_user_model
-from crm.models import Client, Project
+from crm.models import Client, Project, ReminderOutbox
+from crm.reminders import queue_due_reminders
 
 User = get_user_model()
 
@@ -83,3 +87,133 @@ def test_delete_project():
 
     assert response.status_code == 204
     assert Project.objects.count() == 0
+
+
+@pytest.mark.django_db
+def test_create_project_for_foreign_client_rejected():
+    user = User.objects.create_user(username="user5", password="pass1234")
+    other = User.objects.create_user(username="user6", password="pass1234")
+    foreign = Client.objects.create(name="Not Mine", owner=other)
+
+    client = APIClient()
+    client.force_authenticate(user=user)
+
+    payload = {"title": "Sneaky", "status": "ongoing", "client": foreign.id}
+    response = client.post(reverse("project-list"), payload, format="json")
+
+    assert response.status_code == 400
+    assert Project.objects.count() == 0
+
+
+@pytest.mark.django_db
+def test_project_owner_follows_client():
+    user = User.objects.create_user(username="user7", password="pass1234")
+    other = User.objects.create_user(username="user8", password="pass1234")
+    c1 = Client.objects.create(name="Client A", owner=user)
+    project = Project.objects.create(title="P1", status="ongoing", client=c1)
+    assert project.owner_id == user.id
+
+    # Handing the client to another user moves its projects too
+    c1.owner = other
+    c1.save()
+    project.refresh_from_db()
+    assert project.owner_id == other.id
+
+    client = APIClient()
+    client.force_authenticate(user=user)
+    response = client.get(reverse("project-list"))
+    assert response.status_code == 200
+    assert len(response.data) == 0
+
+
+@pytest.mark.django_db
+def test_due_projects():
+    user = User.objects.create_user(username="user9", password="pass1234")
+    c1 = Client.objects.create(name="Client A", owner=user)
+    today = timezone.localdate()
+
+    Project.objects.create(title="Late", status="active", client=c1, due_date=today - timedelta(days=2))
+    Project.objects.create(title="Soon", status="active", client=c1, due_date=today + timedelta(days=3))
+    Project.objects.create(title="Later", status="active", client=c1, due_date=today + timedelta(days=30))
+    Project.objects.create(title="Done", status="completed", client=c1, due_date=today - timedelta(days=5))
+    Project.objects.create(title="Dropped", status="cancelled", client=c1, due_date=today - timedelta(days=5))
+    Project.objects.create(title="Undated", status="active", client=c1)
+
+    client = APIClient()
+    client.force_authenticate(user=user)
+
+    response = client.get(reverse("project-due") + "?days=7")
+
+    assert response.status_code == 200
+    assert [p["title"] for p in response.data["overdue"]] == ["Late"]
+    assert [p["title"] for p in response.data["due_soon"]] == ["Soon"]
+
+
+@pytest.mark.django_db
+def test_send_due_reminders_is_idempotent():
+    today = timezone.localdate()
+    for i in range(3):
+        user = User.objects.create_user(username=f"remind{i}", password="pass1234")
+        c1 = Client.objects.create(name="Client", owner=user)
+        Project.objects.create(title="Late", status="active", client=c1, due_date=today - timedelta(days=1))
+        Project.objects.create(title="Done", status="completed", client=c1, due_date=today)
+        Project.objects.create(title="Dropped", status="cancelled", client=c1, due_date=today - timedelta(days=1))
+
+    call_command("send_due_reminders", "--owner-batch", "2", "--chunk-size", "1")
+    call_command("send_due_reminders")
+
+    assert ReminderOutbox.objects.count() == 3
+    assert set(ReminderOutbox.objects.values_list("kind", flat=True)) == {"overdue"}
+
+
+@pytest.mark.django_db
+def test_queue_due_reminders_stops_per_chunk_and_resumes():
+    today = timezone.localdate()
+    for i in range(3):
+        user = User.objects.create_user(username=f"chunk{i}", password="pass1234")
+        c1 = Client.objects.create(name="Client", owner=user)
+        for days in (1, 2):
+            Project.objects.create(title="Late", client=c1, due_date=today - timedelta(days=days))
+
+    # The limit has passed by the first chunk, yet every run finishes at least one owner.
+    after_owner, runs = 0, 0
+    finished = False
+    while not finished:
+        candidates, after_owner, finished = queue_due_reminders(
+            today, days=7, chunk_size=1, time_limit=1e-9, after_owner=after_owner,
+        )
+        runs += 1
+        assert runs <= 4
+        assert finished or candidates <= 3  # stopped mid-batch, not after all owners
+
+    assert ReminderOutbox.objects.count() == 6
+
+    # A full re-run checks the same projects again without queueing duplicates.
+    assert queue_due_reminders(today, days=7)[0] == 6
+    assert ReminderOutbox.objects.count() == 6
+
+
+@pytest.mark.django_db
+def test_status_is_normalized_and_filterable():
+    user = User.objects.create_user(username="user10", password="pass1234")
+    c1 = Client.objects.create(name="Client A", owner=user)
+    Project.objects.create(title="Legacy", status="Ongoing", client=c1)
+    Project.objects.create(title="Done", status="completed", client=c1, payment_status="paid")
+
+    client = APIClient()
+    client.force_authenticate(user=user)
+
+    response = client.get(reverse("project-list") + "?status=active")
+    assert response.status_code == 200
+    assert [p["title"] for p in response.data] == ["Legacy"]
+    assert response.data[0]["status"] == "active"
+
+    response = client.get(reverse("project-list") + "?payment_status=paid")
+    assert [p["title"] for p in response.data] == ["Done"]
+
+    response = client.get(reverse("project-list") + "?status=bogus")
+    assert response.status_code == 400
+
+    payload = {"title": "Bad", "status": "whatever", "client": c1.id}
+    response = client.post(reverse("project-list"), payload, format="json")
+    assert response.status_code == 400
@@ -0,0 +1,250 @@
+# Query-budget regression harness.
+# Every route in crm/urls.py (plus the admin changelists) is requested at several
+# data sizes. The number of queries must not grow with the number of rows and must
+# stay within the budget below, and the SQL + EXPLAIN plan of the largest run is
+# compared against a snapshot in crm/tests/query_snapshots/<db vendor>/.
+#
+# A missing snapshot fails the test. Create or refresh snapshots (after an
+# intentional change, or for a new database backend) with:
+#   UPDATE_QUERY_SNAPSHOTS=1 pytest crm/tests/test_query_budget.py
+import difflib
+import os
+import re
+from datetime import date, timedelta
+from decimal import Decimal
+from pathlib import Path
+
+import pytest
+from django.db import connection
+from django.test import Client as DjangoClient
+from django.test.utils import CaptureQueriesContext
+from django.urls import get_resolver
+from rest_framework.test import APIClient
+from django.contrib.auth import get_user_model
+from django.contrib.admin import site
+from crm import readiness
+from crm.admin import ScalableAdmin
+from crm.models import Client, Project
+from crm.reports import rebuild_revenue
+
+User = get_user_model()
+
+SIZES = (1, 10, 30)
+SNAPSHOT_DIR = Path(__file__).parent / "query_snapshots"
+
+
+def _seed(user, size):
+    # Client.save() fills the duplicate-lookup keys, so no bulk_create here.
+    clients = [
+        Client.objects.create(owner=user, name=f"Client {i}", phone=f"07{i:08d}")
+        for i in range(size)
+    ]
+    Project.objects.bulk_create(
+        [
+            Project(
+                client=c, owner=user, title=f"Project {i}",
+                status="completed" if i % 2 else "active",
+                due_date=date(2025, 1, 1) + timedelta(days=31 * i),
+                payment_amount=Decimal("10.00"),
+            )
+            for i, c in enumerate(clients)
+        ]
+    )
+    # One duplicate of the first client, for the duplicates/merge routes.
+    duplicate = Client.objects.create(owner=user, name="Client 0 again", phone=clients[0].phone)
+    rebuild_revenue(owner_id=user.id)
+    return clients[0], Project.objects.filter(owner=user).first(), duplicate
+
+
+# name → (route name it covers, method, url, body, query budget)
+# url/body are callables taking the seeded (client, project, duplicate client).
+CASES = {
+    "api-root": ("api-root", "get", lambda c, p, d: "/api/", None, 0),
+    "client-list": ("client-list", "get", lambda c, p, d: "/api/clients/", None, 1),
+    "client-detail": ("client-detail", "get", lambda c, p, d: f"/api/clients/{c.id}/", None, 1),
+    "client-duplicates": ("client-duplicates", "get", lambda c, p, d: "/api/clients/duplicates/", None, 4),
+    "client-merge": (
+        "client-merge", "post", lambda c, p, d: f"/api/clients/{c.id}/merge/",
+        lambda c, p, d: {"duplicates": [d.id]}, 8,
+    ),
+    "project-list": ("project-list", "get", lambda c, p, d: "/api/projects/", None, 1),
+    "project-list-by-client": (
+        "project-list", "get", lambda c, p, d: f"/api/projects/?client={c.id}", None, 1,
+    ),
+    "project-list-by-status": (
+        "project-list", "get", lambda c, p, d: "/api/projects/?status=active&payment_status=unpaid", None, 1,
+    ),
+    "project-create": (
+        "project-list", "post", lambda c, p, d: "/api/projects/",
+        lambda c, p, d: {"title": "New", "client": c.id, "due_date": "2099-01-01"}, 8,
+    ),
+    "project-due": ("project-due", "get", lambda c, p, d: "/api/projects/due/?days=366", None, 1),
+    "project-detail": ("project-detail", "get", lambda c, p, d: f"/api/projects/{p.id}/", None, 1),
+    "register": (
+        "register", "post", lambda c, p, d: "/api/register/",
+        lambda c, p, d: {"username": "budget-new-user", "password": "pass1234"}, 3,
+    ),
+    "revenue-report": (
+        "revenue-report", "get", lambda c, p, d: "/api/reports/revenue/?from=2024-01&to=2030-12", None, 1,
+    ),
+    "batch": (
+        "batch", "post", lambda c, p, d: "/api/batch/",
+        lambda c, p, d: {"requests": [{"path": "/api/clients/"}, {"path": "/api/projects/"}]}, 2,
+    ),
+    "health": ("health", "get", lambda c, p, d: "/api/health/", None, 0),
+    # Just the SELECT 1: caching is off and migrations count as checked (see below)
+    "ready": ("ready", "get", lambda c, p, d: "/api/ready/", None, 1),
+}
+
+ADMIN_PER_PAGE = 10
+
+ADMIN_CASES = {
+    "admin-client-changelist": ("/admin/crm/client/", 4),
+    "admin-project-changelist": ("/admin/crm/project/", 5),
+    "admin-project-changelist-by-status": ("/admin/crm/project/?status__exact=completed", 5),
+}
+
+
+def _normalize(sql):
+    # Strip literal values so snapshots only change when the query shape does.
+    sql = re.sub(r"'(?:[^']|'')*'", "?", sql)
+    sql = re.sub(r'"s\d+_x\d+"', '"<savepoint>"', sql)
+    sql = re.sub(r"\b\d+(\.\d+)?\b", "?", sql)
+    return sql
+
+
+def _explain(sql):
+    if not sql.lstrip().upper().startswith("SELECT"):
+        return []
+    with connection.cursor() as cursor:
+        cursor.execute(f"{connection.ops.explain_query_prefix()} {sql}")
+        rows = cursor.fetchall()
+    # SQLite returns (id, parent, notused, detail); Postgres returns one text column.
+    return [_normalize(str(row[-1])) for row in rows]
+
+
+def _render_snapshot(queries):
+    lines = []
+    for i, query in enumerate(queries, 1):
+        lines.append(f"-- query {i}")
+        lines.append(_normalize(query["sql"]))
+        lines.extend(f"   plan: {step}" for step in _explain(query["sql"]))
+    return "\n".join(lines) + "\n"
+
+
+def _check_snapshot(name, queries):
+    path = SNAPSHOT_DIR / connection.vendor / f"{name}.sql"
+    actual = _render_snapshot(queries)
+    if os.environ.get("UPDATE_QUERY_SNAPSHOTS"):
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(actual)
+        return
+    if not path.exists():
+        # Never create snapshots silently, or a new case / database would pass unchecked.
+        pytest.fail(
+            f"no snapshot {path.relative_to(SNAPSHOT_DIR)}; run with UPDATE_QUERY_SNAPSHOTS=1 "
+            f"on {connection.vendor} and commit it"
+        )
+    expected = path.read_text()
+    if actual != expected:
+        diff = "".join(difflib.unified_diff(
+            expected.splitlines(True), actual.splitlines(True),
+            fromfile=f"{path.name} (snapshot)", tofile=f"{path.name} (now)",
+        ))
+        pytest.fail(f"SQL / plan for {name} changed:\n{diff}")
+
+
+def _measure(size, request):
+    user = User.objects.create_user(username=f"budget{size}", password="pass1234")
+    seeded = _seed(user, size)
+    api = APIClient()
+    api.force_authenticate(user=user)
+    with CaptureQueriesContext(connection) as ctx:
+        response = request(api, *seeded)
+    assert response.status_code < 400, response.content
+    return list(ctx.captured_queries)
+
+
+def _assert_budget(name, budget, runs):
+    counts = {size: len(queries) for size, queries in runs.items()}
+    assert len(set(counts.values())) == 1, f"{name}: query count grows with rows {counts}"
+    assert counts[SIZES[-1]] <= budget, (
+        f"{name}: {counts[SIZES[-1]]} queries, budget is {budget}\n"
+        + "\n".join(q["sql"] for q in runs[SIZES[-1]])
+    )
+    _check_snapshot(name, runs[SIZES[-1]])
+
+
+def test_every_route_has_a_budget():
+    names = set()
+    stack = list(get_resolver("crm.urls").url_patterns)
+    while stack:
+        pattern = stack.pop()
+        if hasattr(pattern, "url_patterns"):
+            stack.extend(pattern.url_patterns)
+        else:
+            names.add(pattern.name)
+    covered = {route for route, *_ in CASES.values()}
+    assert names <= covered, f"routes without a query budget: {sorted(names - covered)}"
+
+
+def test_no_stale_snapshots():
+    # A snapshot without a case means a case was removed or renamed.
+    cases = set(CASES) | set(ADMIN_CASES)
+    stale = sorted(
+        f"{path.parent.name}/{path.name}"
+        for path in SNAPSHOT_DIR.glob("*/*.sql")
+        if path.stem not in cases
+    )
+    assert not stale, f"snapshots without a case: {stale}"
+
+
+@pytest.fixture
+def fast_passwords(settings):
+    settings.PASSWORD_HASHERS = ["django.contrib.auth.hashers.MD5PasswordHasher"]
+
+
+@pytest.fixture
+def no_readiness_cache(settings, monkeypatch):
+    # Every run must execute the readiness probes, not reuse a cached answer. The
+    # one-off migration check is marked done so each size measures the steady state.
+    settings.READINESS_CACHE_SECONDS = 0
+    monkeypatch.setattr(readiness, "_migrations_applied", True)
+
+
+@pytest.mark.django_db
+@pytest.mark.usefixtures("fast_passwords", "no_readiness_cache")
+@pytest.mark.parametrize("name", sorted(CASES))
+def test_api_query_budget(name):
+    _, method, url, body, budget = CASES[name]
+
+    def request(api, *seeded):
+        data = body(*seeded) if body else None
+        return getattr(api, method)(url(*seeded), data, format="json")
+
+    runs = {}
+    for size in SIZES:
+        runs[size] = _measure(size, request)
+        # register creates a fixed username; start each size from a clean slate
+        User.objects.filter(username__startswith="budget-new").delete()
+    _assert_budget(name, budget, runs)
+
+
+@pytest.mark.django_db
+@pytest.mark.usefixtures("fast_passwords")
+@pytest.mark.parametrize("name", sorted(ADMIN_CASES))
+def test_admin_query_budget(name, monkeypatch):
+    url, budget = ADMIN_CASES[name]
+    # Rows pile up across SIZES (1, 11, 41 projects); a small page makes the largest
+    # run paginate, so LIMIT / EstimatedCountPaginator are what gets snapshotted.
+    for model_admin in site._registry.values():
+        if isinstance(model_admin, ScalableAdmin):
+            monkeypatch.setattr(model_admin, "list_per_page", ADMIN_PER_PAGE)
+    admin_user = User.objects.create_superuser(username="budget-admin", password="pass1234")
+    browser = DjangoClient()
+    browser.force_login(admin_user)
+
+    runs = {}
+    for size in SIZES:
+        runs[size] = _measure(size, lambda api, *seeded: browser.get(url))
+    _assert_budget(name, budget, runs)
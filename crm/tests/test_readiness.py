@@ -0,0 +1,79 @@
+import pytest
+from django.db import connection
+from django.db.migrations.executor import MigrationExecutor
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from rest_framework.test import APIClient
+from crm import readiness
+
+
+@pytest.fixture(autouse=True)
+def fresh_probe():
+    readiness.reset()
+    yield
+    readiness.reset()
+
+
+@pytest.mark.django_db
+def test_ready_reports_ok():
+    response = APIClient().get(reverse("ready"))
+
+    assert response.status_code == 200
+    assert response["X-Readiness"] == "ok"
+    assert response.data["status"] == "ok"
+    checks = response.data["checks"]
+    assert checks["database"]["latency_ms"] >= 0
+    assert checks["migrations"]["pending"] == 0
+    assert checks["back_pressure"]["in_flight"] == 1  # the probe itself
+
+
+@pytest.mark.django_db
+def test_ready_is_cached():
+    client = APIClient()
+    client.get(reverse("ready"))
+
+    with CaptureQueriesContext(connection) as ctx:
+        response = client.get(reverse("ready"))
+    assert response.status_code == 200
+    assert len(ctx.captured_queries) == 0
+
+
+@pytest.mark.django_db
+def test_ready_degraded_when_busy(settings):
+    settings.READINESS_MAX_IN_FLIGHT = 1  # a one-thread worker is saturated by the probe
+    settings.READINESS_DEGRADED_STATUS = 429
+
+    response = APIClient().get(reverse("ready"))
+
+    assert response.status_code == 429
+    assert response["X-Readiness"] == "degraded"
+    assert response.data["checks"]["back_pressure"]["status"] == "degraded"
+
+
+@pytest.mark.django_db
+def test_ready_unavailable_with_pending_migrations(monkeypatch):
+    monkeypatch.setattr(MigrationExecutor, "migration_plan", lambda self, targets: [("crm", "0099")])
+
+    response = APIClient().get(reverse("ready"))
+
+    assert response.status_code == 503
+    assert response.data["status"] == "unavailable"
+    assert response.data["checks"]["migrations"]["pending"] == 1
+
+
+def test_health_stays_trivial():
+    # Liveness must not touch the DB: a slow database shouldn't get workers restarted.
+    response = APIClient().get(reverse("health"))
+    assert response.data == {"status": "ok"}
+
+
+@pytest.mark.django_db
+def test_migration_check_runs_until_it_passes(settings):
+    settings.READINESS_CACHE_SECONDS = 0
+    client = APIClient()
+    client.get(reverse("ready"))
+
+    with CaptureQueriesContext(connection) as ctx:
+        response = client.get(reverse("ready"))
+    assert response.data["checks"]["migrations"] == {"status": "ok", "pending": 0}
+    assert len(ctx.captured_queries) == 1  # SELECT 1 only
@@ -0,0 +1,113 @@
+import pytest
+from datetime import date
+from decimal import Decimal
+from django.core.management import call_command
+from django.urls import reverse
+from rest_framework.test import APIClient
+from django.contrib.auth import get_user_model
+from crm.models import Client, Project, MonthlyRevenue
+
+User = get_user_model()
+
+
+@pytest.mark.django_db
+def test_rollup_maintained_on_write():
+    user = User.objects.create_user(username="rev1", password="pass1234")
+    c1 = Client.objects.create(name="Client A", owner=user)
+
+    project = Project.objects.create(
+        title="P1", client=c1, due_date=date(2025, 3, 14),
+        payment_amount=Decimal("100.00"), payment_status="unpaid",
+    )
+    bucket = MonthlyRevenue.objects.get(owner=user, month=date(2025, 3, 1), payment_status="unpaid")
+    assert bucket.project_count == 1
+    assert bucket.total_amount == Decimal("100.00")
+
+    # Marking it paid moves the amount to the "paid" bucket
+    project.payment_status = "paid"
+    project.save()
+    bucket.refresh_from_db()
+    assert bucket.project_count == 0
+    assert bucket.total_amount == Decimal("0.00")
+    paid = MonthlyRevenue.objects.get(owner=user, month=date(2025, 3, 1), payment_status="paid")
+    assert paid.total_amount == Decimal("100.00")
+
+    project.delete()
+    paid.refresh_from_db()
+    assert paid.project_count == 0
+
+
+@pytest.mark.django_db
+def test_backfill_matches_incremental():
+    user = User.objects.create_user(username="rev2", password="pass1234")
+    c1 = Client.objects.create(name="Client A", owner=user)
+    for day, amount, status in [(1, "10.00", "paid"), (20, "5.50", "paid"), (3, "7.00", "unpaid")]:
+        Project.objects.create(
+            title=f"P{day}", client=c1, due_date=date(2025, 1, day),
+            payment_amount=Decimal(amount), payment_status=status,
+        )
+    incremental = sorted(
+        MonthlyRevenue.objects.values_list("month", "payment_status", "project_count", "total_amount")
+    )
+
+    MonthlyRevenue.objects.all().delete()
+    call_command("backfill_revenue")
+
+    rebuilt = sorted(
+        MonthlyRevenue.objects.values_list("month", "payment_status", "project_count", "total_amount")
+    )
+    assert rebuilt == incremental
+
+
+@pytest.mark.django_db
+def test_revenue_report():
+    user = User.objects.create_user(username="rev3", password="pass1234")
+    other = User.objects.create_user(username="rev4", password="pass1234")
+    c1 = Client.objects.create(name="Client A", owner=user)
+    c2 = Client.objects.create(name="Client B", owner=other)
+
+    Project.objects.create(title="A", client=c1, due_date=date(2025, 1, 5),
+                           payment_amount=Decimal("100.00"), payment_status="paid")
+    Project.objects.create(title="B", client=c1, due_date=date(2025, 1, 9),
+                           payment_amount=Decimal("50.00"), payment_status="unpaid")
+    Project.objects.create(title="C", client=c1, due_date=date(2025, 4, 1),
+                           payment_amount=Decimal("20.00"), payment_status="paid")
+    Project.objects.create(title="D", client=c2, due_date=date(2025, 1, 5),
+                           payment_amount=Decimal("999.00"), payment_status="paid")
+
+    client = APIClient()
+    client.force_authenticate(user=user)
+
+    url = reverse("revenue-report") + "?from=2025-01&to=2025-03"
+    response = client.get(url)
+
+    assert response.status_code == 200
+    assert len(response.data["results"]) == 1
+    january = response.data["results"][0]
+    assert january["month"] == "2025-01"
+    assert january["totals"][0]["billed"] == "150.00"
+    assert january["totals"][0]["collected"] == "100.00"
+
+
+@pytest.mark.django_db
+def test_revenue_report_rejects_bad_range():
+    user = User.objects.create_user(username="rev5", password="pass1234")
+    client = APIClient()
+    client.force_authenticate(user=user)
+
+    response = client.get(reverse("revenue-report") + "?from=2025-13")
+    assert response.status_code == 400
+
+    response = client.get(reverse("revenue-report") + "?from=2025-05&to=2025-01")
+    assert response.status_code == 400
+
+
+@pytest.mark.django_db
+def test_revenue_report_default_range_stops_at_year_one():
+    user = User.objects.create_user(username="rev6", password="pass1234")
+    client = APIClient()
+    client.force_authenticate(user=user)
+
+    response = client.get(reverse("revenue-report") + "?to=0001-03")
+    assert response.status_code == 200
+    assert response.data["from"] == "0001-01"
@@ -4,8 +4,9 @@ from rest_framework.routers import DefaultRouter
 # for your ViewSets.
 # Without it, you’d have to manually write all the paths for list, 
 # retrieve, create, update, and delete.
-from .views import ClientViewSet, ProjectViewSet, HealthCheckView
+from .views import ClientViewSet, ProjectViewSet, HealthCheckView, ReadinessView, RevenueReportView
 from .register import RegisterView
+from .batch import BatchView
 # ✅ API router
 router = DefaultRouter()
 router.register(r"clients", ClientViewSet, basename="client")
@@ -15,8 +16,12 @@ urlpatterns = [
     # API endpoints
     path("", include(router.urls)),
     path("register/", RegisterView.as_view(), name="register"),
+    path("reports/revenue/", RevenueReportView.as_view(), name="revenue-report"),
+    path("batch/", BatchView.as_view(), name="batch"),
 
     # Health check endpoint for uptime ping
-   path("health/", HealthCheckView.as_view()),
+   path("health/", HealthCheckView.as_view(), name="health"),
+    # Readiness for the load balancer: DB, migrations, back-pressure
+    path("ready/", ReadinessView.as_view(), name="ready"),
 
 ]
@@ -3,13 +3,23 @@ from rest_framework import viewsets, permissions, mixins, generics
 #  actions automatically for a model.
 # generics.ListAPIView → Quick way to build read-only list endpoints (like nested routes).
 
-from .models import Client, Project
-from .serializers import ClientSerializer, ProjectSerializer
+from datetime import date, datetime
+from decimal import Decimal
+
+from .models import Client, Project, MonthlyRevenue
+from .serializers import ClientSerializer, ClientMergeSerializer, ProjectSerializer
+from .duplicates import find_duplicate_groups, merge_clients
+from .reminders import open_due_projects, reminder_kind
+from .readiness import readiness, OK, DEGRADED
+from django.conf import settings
 from django.contrib.auth import get_user_model
 from django.http import JsonResponse
+from django.utils import timezone
 from rest_framework.views import APIView
 from rest_framework.response import Response
 from rest_framework.permissions import AllowAny
+from rest_framework.exceptions import ValidationError
+from rest_framework.decorators import action
 
 class HealthCheckView(APIView):
     permission_classes = [AllowAny]
@@ -18,12 +28,32 @@ class HealthCheckView(APIView):
     def get(self, request):
         return Response({"status": "ok"})
 
+
+class ReadinessView(APIView):
+    # GET /api/ready/ → is this worker fit to take traffic? (see crm/readiness.py)
+    # /api/health/ above stays a plain liveness check.
+    permission_classes = [AllowAny]
+    authentication_classes = []
+
+    def get(self, request):
+        result = readiness()
+        if result["status"] == OK:
+            code = 200
+        elif result["status"] == DEGRADED:
+            code = settings.READINESS_DEGRADED_STATUS
+        else:
+            code = 503
+        response = Response(result, status=code)
+        # Header form of the status, for load balancers that can't read the body.
+        response["X-Readiness"] = result["status"]
+        return response
+
 User = get_user_model()
 
 
 class IsOwner(permissions.BasePermission):
     def has_object_permission(self, request, view, obj):
-        # only for Client; Project/Invoice are tied via Client
+        # Client and Project both carry owner_id (Project's mirrors its client's)
         return getattr(obj, "owner_id", None) == request.user.id
     # Purpose: Make sure only the user who owns the object can view/edit it
     # has_object_permission → Runs for requests to specific objects (like GET /clients/5/
@@ -51,18 +81,47 @@ class ClientViewSet(viewsets.ModelViewSet):
         serializer.save(owner=self.request.user)
         # Saves the client with the logged-in user as the owner.
 
+    @action(detail=False, methods=["get"])
+    def duplicates(self, request):
+        # GET /api/clients/duplicates/ → groups of clients sharing a normalized
+        # phone, email or company name.
+        groups = find_duplicate_groups(request.user)
+        return Response([
+            {
+                "reasons": group["reasons"],
+                "clients": ClientSerializer(group["clients"], many=True).data,
+            }
+            for group in groups
+        ])
+
+    @action(detail=True, methods=["post"])
+    def merge(self, request, pk=None):
+        # POST /api/clients/<id>/merge/ {"duplicates": [..]} → re-points the
+        # duplicates' projects to this client and deletes the duplicates.
+        target = self.get_object()
+        serializer = ClientMergeSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+
+        ids = set(serializer.validated_data["duplicates"]) - {target.id}
+        found = set(self.get_queryset().filter(id__in=ids).values_list("id", flat=True))
+        if not ids or found != ids:
+            raise ValidationError({"duplicates": "Unknown client id(s)."})
+
+        moved = merge_clients(target, found)
+        return Response({"client": target.id, "merged": sorted(found), "projects_moved": moved})
+
 
 class ProjectViewSet(viewsets.ModelViewSet):
     serializer_class = ProjectSerializer
-    permission_classes = [permissions.IsAuthenticated]
+    permission_classes = [permissions.IsAuthenticated, IsOwner]
 
     def get_queryset(self):
-        # A project must belong to a client whose owner is the logged-in user.
-        # client__owner is Django ORM’s way of filtering across relationships.
+        # A project must belong to the logged-in user. Project.owner mirrors
+        # client.owner, so this is a single-table filter on the (owner, client) index.
         qs = (
             Project.objects
             .select_related("client")  # select_related → avoid extra queries when accessing client
-            .filter(client__owner=self.request.user)
+            .filter(owner=self.request.user)
         )
 
         # Optional filter: /api/projects?client=<id>
@@ -71,10 +130,106 @@ class ProjectViewSet(viewsets.ModelViewSet):
         if client_id:
             qs = qs.filter(client_id=client_id)
 
-        return qs
-
-
+        # Optional filters: /api/projects?status=<s>&payment_status=<s>
+        # Both are backed by (owner, <field>) indexes on the small integer codes.
+        for param in ("status", "payment_status"):
+            value = self.request.query_params.get(param)
+            if value:
+                field = Project._meta.get_field(param)
+                value = field.normalize(value)
+                if value not in field.codes:
+                    raise ValidationError({param: f"Unknown value. Expected one of: {', '.join(field.codes)}."})
+                qs = qs.filter(**{param: value})
 
+        return qs
 
+    @action(detail=False, methods=["get"])
+    def due(self, request):
+        # GET /api/projects/due/?days=7 → open projects that are overdue or due
+        # within `days` days, soonest first. Served by the partial index on
+        # (owner, due_date) that leaves closed projects out.
+        try:
+            days = int(request.query_params.get("days", 7))
+        except ValueError:
+            raise ValidationError({"days": "Expected a whole number of days."})
+        if not 0 <= days <= 366:
+            raise ValidationError({"days": "Must be between 0 and 366."})
+
+        today = timezone.localdate()
+        projects = open_due_projects(self.get_queryset(), today, days).order_by("due_date", "id")
+
+        grouped = {"overdue": [], "due_soon": []}
+        for project in projects:
+            grouped[reminder_kind(project.due_date, today)].append(project)
+        return Response({
+            kind: ProjectSerializer(items, many=True).data for kind, items in grouped.items()
+        })
+
+
+def _parse_month(value, param):
+    # Accepts "YYYY-MM" and returns the first day of that month.
+    try:
+        return datetime.strptime(value, "%Y-%m").date()
+    except (TypeError, ValueError):
+        raise ValidationError({param: "Expected a month in YYYY-MM format."})
+
+
+def _format_month(day):
+    # strftime("%Y") doesn't zero-pad years before 1000 on every platform.
+    return f"{day.year:04d}-{day.month:02d}"
+
+
+class RevenueReportView(APIView):
+    # GET /api/reports/revenue/?from=YYYY-MM&to=YYYY-MM
+    # Billed (all statuses) and collected (paid) amounts per month and currency,
+    # read from the MonthlyRevenue rollup so the cost grows with the number of
+    # months asked for, not with the number of projects.
+    permission_classes = [permissions.IsAuthenticated]
 
+    def get(self, request):
+        today = timezone.localdate()
+        end = _parse_month(request.query_params.get("to", _format_month(today)), "to")
+        if "from" in request.query_params:
+            start = _parse_month(request.query_params["from"], "from")
+        else:
+            # Default to the trailing 12 months, including the current one
+            # (never before January of year 1, the earliest date Python has).
+            months_back = max(end.year * 12 + end.month - 1 - 11, 12)
+            start = date(months_back // 12, months_back % 12 + 1, 1)
+        if start > end:
+            raise ValidationError({"from": "Must not be after 'to'."})
+
+        rows = (
+            MonthlyRevenue.objects
+            .filter(owner=request.user, month__gte=start, month__lte=end, project_count__gt=0)
+            .order_by("month", "payment_currency")
+            .values_list("month", "payment_currency", "payment_status", "project_count", "total_amount")
+        )
 
+        months = {}
+        for month, currency, payment_status, count, amount in rows:
+            totals = months.setdefault(month, {}).setdefault(currency, {
+                "currency": currency,
+                "project_count": 0,
+                "billed": Decimal("0.00"),
+                "collected": Decimal("0.00"),
+                "by_status": {},
+            })
+            totals["project_count"] += count
+            totals["billed"] += amount
+            if payment_status == "paid":
+                totals["collected"] += amount
+            totals["by_status"][payment_status] = str(amount)
+
+        results = []
+        for month, currencies in months.items():
+            for totals in currencies.values():
+                totals["billed"] = str(totals["billed"])
+                totals["collected"] = str(totals["collected"])
+            results.append({"month": _format_month(month), "totals": list(currencies.values())})
+
+        return Response({
+            "from": _format_month(start),
+            "to": _format_month(end),
+            "results": results,
+        })
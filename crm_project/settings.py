@@ -61,6 +61,8 @@ INSTALLED_APPS = [
 
 MIDDLEWARE = [
     "corsheaders.middleware.CorsMiddleware",  # MUST be first
+    "crm.log.RequestLogMiddleware",  # request id + timing for everything below it
+    "crm.readiness.InFlightMiddleware",  # busy-request count for /api/ready/
     "django.middleware.security.SecurityMiddleware",
     "django.contrib.sessions.middleware.SessionMiddleware",
     "django.middleware.common.CommonMiddleware",
@@ -83,21 +85,58 @@ CORS_ALLOW_HEADERS = [
     "user-agent",
     "x-csrftoken",
     "x-requested-with",
+    "x-request-id",
 ]
 
 # REST Framework & JWT
 REST_FRAMEWORK = {
     "DEFAULT_AUTHENTICATION_CLASSES": (
-        "rest_framework_simplejwt.authentication.JWTAuthentication",
+        "crm.authentication.RevocationAwareJWTAuthentication",
     ),
     "DEFAULT_PERMISSION_CLASSES": ("rest_framework.permissions.IsAuthenticated",),
 }
 
+# /api/batch/ limits: max sub-requests per call, and threads used for parallel reads
+BATCH_MAX_REQUESTS = env.int("BATCH_MAX_REQUESTS", default=20)
+BATCH_MAX_WORKERS = env.int("BATCH_MAX_WORKERS", default=4)
+
+# Country code assumed for local phone numbers ("0712…") when matching duplicate clients
+DEFAULT_PHONE_COUNTRY_CODE = env("DEFAULT_PHONE_COUNTRY_CODE", default="254")
+
 SIMPLE_JWT = {
     "AUTH_HEADER_TYPES": ("Bearer",),
     "LEEWAY": 60,
+    # Each refresh hands out a new refresh token and revokes the old one.
+    "ROTATE_REFRESH_TOKENS": True,
+    "TOKEN_REFRESH_SERIALIZER": "crm.auth.RotatingTokenRefreshSerializer",
 }
 
+# Token revocation (crm/revocation.py): revoked jtis live in memory per worker and
+# are pulled from the DB at most every REVOCATION_SYNC_SECONDS. Each pull re-reads the
+# last REVOCATION_SYNC_OVERLAP_SECONDS of rows (a row can commit after newer ones
+# are visible), and every REVOCATION_FULL_SYNC_SECONDS all unexpired rows are
+# reloaded in case a transaction ran longer than that.
+REVOCATION_SYNC_SECONDS = env.float("REVOCATION_SYNC_SECONDS", default=2.0)
+REVOCATION_SYNC_OVERLAP_SECONDS = env.float("REVOCATION_SYNC_OVERLAP_SECONDS", default=60.0)
+REVOCATION_FULL_SYNC_SECONDS = env.float("REVOCATION_FULL_SYNC_SECONDS", default=300.0)
+REVOCATION_BLOOM_CAPACITY = env.int("REVOCATION_BLOOM_CAPACITY", default=100_000)
+
+# Threads per gunicorn worker (Procfile: --threads ${WEB_THREADS:-4}).
+WEB_THREADS = env.int("WEB_THREADS", default=4)
+
+# Readiness probe (/api/ready/, crm/readiness.py). Results are cached per worker for
+# READINESS_CACHE_SECONDS. The worker reports "degraded" when the SELECT 1 round-trip
+# is slower than READINESS_DB_SLOW_MS, when READINESS_MAX_IN_FLIGHT requests are
+# running (the probe included; by default every thread is busy) or when more than
+# READINESS_MAX_LOG_BACKLOG log records are waiting. Degraded answers use
+# READINESS_DEGRADED_STATUS (200 keeps the worker in rotation; set 503 or 429 to
+# have the load balancer drain it). "unavailable" (DB down, unapplied migrations) is 503.
+READINESS_CACHE_SECONDS = env.float("READINESS_CACHE_SECONDS", default=2.0)
+READINESS_DB_SLOW_MS = env.float("READINESS_DB_SLOW_MS", default=100.0)
+READINESS_MAX_IN_FLIGHT = env.int("READINESS_MAX_IN_FLIGHT", default=WEB_THREADS)
+READINESS_MAX_LOG_BACKLOG = env.int("READINESS_MAX_LOG_BACKLOG", default=10_000)
+READINESS_DEGRADED_STATUS = env.int("READINESS_DEGRADED_STATUS", default=200)
+
 ROOT_URLCONF = "crm_project.urls"
 
 TEMPLATES = [
@@ -138,16 +177,52 @@ STATIC_URL = "static/"
 # Default primary key field type
 DEFAULT_AUTO_FIELD = "django.db.models.BigAutoField"
 
+# Logging: JSON lines written from a background thread (see crm/log.py).
+# LOG_LEVEL          → level for the root / django / crm loggers
+# DB_LOG_LEVEL       → django.db.backends (SQL); only logs SQL when DEBUG too
+# DB_LOG_SAMPLE_RATE → share of SQL records kept when DB_LOG_LEVEL is DEBUG
+LOG_LEVEL = env("LOG_LEVEL", default="DEBUG" if DEBUG else "INFO")
+DB_LOG_LEVEL = env("DB_LOG_LEVEL", default="WARNING")
+DB_LOG_SAMPLE_RATE = env.float("DB_LOG_SAMPLE_RATE", default=0.01)
+
 LOGGING = {
     "version": 1,
     "disable_existing_loggers": False,
+    "formatters": {
+        "json": {"()": "crm.log.JsonFormatter"},
+    },
+    "filters": {
+        "request_context": {"()": "crm.log.RequestContextFilter"},
+        "db_sample": {"()": "crm.log.SampleFilter", "rate": DB_LOG_SAMPLE_RATE},
+    },
     "handlers": {
         "console": {
-            "class": "logging.StreamHandler",
+            "class": "crm.log.QueuedStreamHandler",
+            "formatter": "json",
+            "filters": ["request_context"],
         },
     },
     "root": {
         "handlers": ["console"],
-        "level": "DEBUG",
+        "level": LOG_LEVEL,
+    },
+    "loggers": {
+        # Replace Django's own defaults (a synchronous, non-JSON stderr handler that
+        # also propagates to root) so django.* records are written once, as JSON,
+        # through the queue, at LOG_LEVEL.
+        "django": {
+            "handlers": ["console"],
+            "level": LOG_LEVEL,
+            "propagate": False,
+        },
+        "django.server": {
+            "handlers": ["console"],
+            "level": LOG_LEVEL,
+            "propagate": False,
+        },
+        "django.db.backends": {
+            "level": DB_LOG_LEVEL,
+            "filters": ["db_sample"],
+        },
     },
 }
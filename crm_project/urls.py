@@ -26,10 +26,13 @@ from rest_framework_simplejwt.views import TokenObtainPairView, TokenRefreshView
 #  receive an access token + refresh token.
 # TokenRefreshView: takes a refresh token and returns a new access token 
 # (so the user doesn’t need to log in again when the access token expires).
+from crm.auth import LogoutView
+# LogoutView: revokes the caller's access token and the given refresh token.
 urlpatterns = [
     path("admin/", admin.site.urls),
     path("api/", include("crm.urls")),   # we'll create this
     path("api/auth/token/", TokenObtainPairView.as_view(), name="token_obtain_pair"),
     path("api/auth/refresh/", TokenRefreshView.as_view(), name="token_refresh"),
+    path("api/auth/logout/", LogoutView.as_view(), name="token_logout"),
 ]
 